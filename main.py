@@ -2,12 +2,19 @@
 
 from __future__ import annotations
 
-import json
+import asyncio
+import hashlib
 import os
+from collections import OrderedDict
+from io import BytesIO
 
-from fastapi import FastAPI, File, Form, HTTPException, UploadFile
-from fastapi.responses import Response
-from pydantic import BaseModel
+import anyio.to_thread
+import orjson
+from fastapi import Depends, FastAPI, File, Form, HTTPException, UploadFile
+from fastapi.responses import FileResponse, ORJSONResponse, StreamingResponse
+from pydantic import BaseModel, ConfigDict
+from sqlalchemy import select
+from sqlalchemy.orm import Session, defer, selectinload
 
 from resume_matcher.ats_optimizer import ATSOptimizer
 from resume_matcher.database import (
@@ -16,6 +23,7 @@ from resume_matcher.database import (
     ResumeRecord,
     get_db,
     init_db,
+    new_id,
 )
 from resume_matcher.generator import ResumeGenerator
 from resume_matcher.job_extractor import JobDescriptionExtractor
@@ -28,10 +36,34 @@ app = FastAPI(
     title="Resume Matcher",
     description="Parse, optimize, and tailor resumes to job descriptions.",
     version="0.2.0",
+    # orjson handles the large parsed-resume dicts far faster than stdlib json
+    default_response_class=ORJSONResponse,
 )
 
-# Initialize database on startup
-init_db()
+
+@app.on_event("startup")
+async def _startup() -> None:
+    """Create tables and size the worker thread pool.
+
+    Running init_db() here instead of at import keeps module import
+    side-effect free and avoids racing workers that fork before the
+    event loop starts.
+    """
+    init_db()
+    # Allow enough worker threads for concurrent parse/generate offloads
+    limiter = anyio.to_thread.current_default_thread_limiter()
+    limiter.total_tokens = min(32, (os.cpu_count() or 4) * 4)
+
+
+async def _run(fn, /, *args):
+    """Run a blocking pipeline stage in a worker thread.
+
+    The parser, ATS checker, analyzer, updater, generator, and job
+    extractor are all synchronous; offloading them keeps the event loop
+    free so concurrent requests actually interleave.
+    """
+    return await anyio.to_thread.run_sync(lambda: fn(*args))
+
 
 # Service instances
 parser = ResumeParser()
@@ -49,6 +81,8 @@ file_storage = FileStorage()
 class JobInput(BaseModel):
     """Input for job description parsing."""
 
+    model_config = ConfigDict(extra="ignore")
+
     url: str | None = None
     text: str | None = None
 
@@ -56,6 +90,8 @@ class JobInput(BaseModel):
 class AnalyzeRequest(BaseModel):
     """Input for gap analysis. Provide IDs or full JSON."""
 
+    model_config = ConfigDict(extra="ignore")
+
     resume_id: str | None = None
     job_id: str | None = None
     resume: dict | None = None
@@ -65,6 +101,8 @@ class AnalyzeRequest(BaseModel):
 class UpdateRequest(BaseModel):
     """Input for resume update."""
 
+    model_config = ConfigDict(extra="ignore")
+
     resume_id: str | None = None
     resume: dict | None = None
     match_report: dict | None = None
@@ -75,6 +113,8 @@ class UpdateRequest(BaseModel):
 class GenerateRequest(BaseModel):
     """Input for .docx generation."""
 
+    model_config = ConfigDict(extra="ignore")
+
     resume: dict | None = None
     resume_id: str | None = None
     analysis_id: str | None = None
@@ -82,48 +122,138 @@ class GenerateRequest(BaseModel):
 
 # ── Helper to look up stored records ────────────────────────────
 
+# Resume/job records are write-once, so parsed dicts can be cached
+# in-process without invalidation. Bounded LRU to cap memory. The
+# resume cache holds (parsed, keywords) pairs so the precomputed
+# keyword set rides along with the parsed dict.
+_CACHE_MAX = 512
+_resume_cache: OrderedDict[str, tuple[dict, list[str]]] = OrderedDict()
+_job_cache: OrderedDict[str, dict] = OrderedDict()
 
-def _get_resume_data(resume_id: str | None, resume_dict: dict | None) -> dict:
+
+def _cache_put(cache: OrderedDict, key: str, value) -> None:
+    cache[key] = value
+    cache.move_to_end(key)
+    while len(cache) > _CACHE_MAX:
+        cache.popitem(last=False)
+
+
+def _get_resume_data(
+    db: Session, resume_id: str | None, resume_dict: dict | None
+) -> dict:
     """Resolve resume data from ID or direct JSON."""
     if resume_dict:
         return resume_dict
     if resume_id:
-        db = get_db()
-        try:
-            record = db.query(ResumeRecord).filter_by(id=resume_id).first()
-            if not record:
-                raise HTTPException(404, f"Resume '{resume_id}' not found.")
-            return record.get_parsed()
-        finally:
-            db.close()
+        cached = _resume_cache.get(resume_id)
+        if cached is not None:
+            _resume_cache.move_to_end(resume_id)
+            return cached[0]
+        record = db.query(ResumeRecord).filter_by(id=resume_id).first()
+        if not record:
+            raise HTTPException(404, f"Resume '{resume_id}' not found.")
+        parsed = record.get_parsed()
+        _cache_put(_resume_cache, resume_id, (parsed, record.keywords or []))
+        return parsed
     raise HTTPException(400, "Provide either 'resume_id' or 'resume' data.")
 
 
-def _get_job_data(job_id: str | None, job_dict: dict | None) -> dict:
+def _get_resume_keywords(db: Session, resume_id: str) -> set[str] | None:
+    """Return a stored resume's precomputed keyword set, if it has one."""
+    cached = _resume_cache.get(resume_id)
+    if cached is None:
+        record = db.query(ResumeRecord).filter_by(id=resume_id).first()
+        if not record:
+            return None
+        cached = (record.get_parsed(), record.keywords or [])
+        _cache_put(_resume_cache, resume_id, cached)
+    keywords = cached[1]
+    return set(keywords) if keywords else None
+
+
+def _get_job_data(db: Session, job_id: str | None, job_dict: dict | None) -> dict:
     """Resolve job data from ID or direct JSON."""
     if job_dict:
         return job_dict
     if job_id:
-        db = get_db()
-        try:
-            record = db.query(JobRecord).filter_by(id=job_id).first()
-            if not record:
-                raise HTTPException(404, f"Job '{job_id}' not found.")
-            return record.get_parsed()
-        finally:
-            db.close()
+        cached = _job_cache.get(job_id)
+        if cached is not None:
+            _job_cache.move_to_end(job_id)
+            return cached
+        record = db.query(JobRecord).filter_by(id=job_id).first()
+        if not record:
+            raise HTTPException(404, f"Job '{job_id}' not found.")
+        parsed = record.get_parsed()
+        _cache_put(_job_cache, job_id, parsed)
+        return parsed
     raise HTTPException(400, "Provide either 'job_id' or 'job' data.")
 
 
+async def _resolve_job(
+    db: Session, job_id: str | None, job_url: str | None, job_text: str | None
+) -> dict:
+    """Resolve a job dict from a stored ID, a URL, or raw text."""
+    if job_id:
+        return _get_job_data(db, job_id, None)
+    try:
+        if job_url:
+            job_result = await _run(job_extractor.from_url, job_url)
+        else:
+            job_result = await _run(job_extractor.from_text, job_text)
+        return job_result.to_dict()
+    except Exception as exc:
+        raise HTTPException(422, f"Failed to parse job description: {exc}")
+
+
 ALLOWED_EXTENSIONS = {".docx", ".pdf"}
+DOCX_MEDIA_TYPE = (
+    "application/vnd.openxmlformats-officedocument.wordprocessingml.document"
+)
 MAX_UPLOAD_SIZE = 20 * 1024 * 1024  # 20 MB
+UPLOAD_CHUNK_SIZE = 64 * 1024  # read uploads in 64 KB chunks
+
+
+async def _read_upload(file: UploadFile) -> bytes:
+    """Read an upload in chunks so the event loop stays responsive.
+
+    Enforces MAX_UPLOAD_SIZE as bytes arrive instead of buffering the
+    whole file first, and raises 413 as soon as the cap is exceeded.
+    """
+    buf = BytesIO()
+    total = 0
+    while chunk := await file.read(UPLOAD_CHUNK_SIZE):
+        total += len(chunk)
+        if total > MAX_UPLOAD_SIZE:
+            raise HTTPException(413, "File too large. Maximum size is 20 MB.")
+        buf.write(chunk)
+    return buf.getvalue()
+
+
+def _stream_docx(buffer: BytesIO, filename: str) -> StreamingResponse:
+    """Stream a generated document in chunks instead of one bytes blob."""
+    size = buffer.getbuffer().nbytes
+
+    def _chunks():
+        while chunk := buffer.read(UPLOAD_CHUNK_SIZE):
+            yield chunk
+
+    return StreamingResponse(
+        _chunks(),
+        media_type=DOCX_MEDIA_TYPE,
+        headers={
+            "Content-Disposition": f"attachment; filename={filename}",
+            "Content-Length": str(size),
+        },
+    )
 
 
 def _get_file_ext(filename: str | None) -> str:
     """Validate filename and return its extension, or raise 400."""
     if not filename:
         raise HTTPException(400, "Filename is required.")
-    ext = os.path.splitext(filename)[1].lower()
+    # Lowercase only the suffix rather than a copy of the whole filename
+    dot = filename.rfind(".")
+    ext = filename[dot:].lower() if dot > 0 else ""
     if ext not in ALLOWED_EXTENSIONS:
         raise HTTPException(
             400,
@@ -136,28 +266,32 @@ def _get_file_ext(filename: str | None) -> str:
 # ── Endpoints ───────────────────────────────────────────────────
 
 
-@app.get("/health")
+@app.get("/health", response_model=None)
 async def health():
     """Health check endpoint."""
     return {"status": "ok"}
 
 
-@app.post("/parse-resume")
-async def parse_resume(file: UploadFile = File(...)):
+@app.post("/parse-resume", response_model=None)
+async def parse_resume(
+    file: UploadFile = File(...), db: Session = Depends(get_db)
+):
     """Upload a .docx or .pdf resume and get back structured JSON.
 
     The parsed result is saved and a `resume_id` is returned.
     Use this ID in subsequent calls to /ats-check, /analyze, etc.
     """
     ext = _get_file_ext(file.filename)
+    contents = await _read_upload(file)
+
+    # Re-uploads of a byte-identical file skip the parser entirely
+    content_hash = hashlib.sha256(contents).hexdigest()
+    existing = db.query(ResumeRecord).filter_by(content_hash=content_hash).first()
+    if existing:
+        return {"resume_id": existing.id, **existing.get_parsed()}
 
     try:
-        contents = await file.read()
-        if len(contents) > MAX_UPLOAD_SIZE:
-            raise HTTPException(413, "File too large. Maximum size is 20 MB.")
-        result = parser.parse_file(contents, file.filename)
-    except HTTPException:
-        raise
+        result = await _run(parser.parse_file, contents, file.filename)
     except ValueError as exc:
         raise HTTPException(status_code=422, detail=str(exc))
     except Exception as exc:
@@ -167,33 +301,34 @@ async def parse_resume(file: UploadFile = File(...)):
 
     parsed_dict = result.to_dict()
 
-    # Save to database and file storage
-    db = get_db()
-    try:
-        record = ResumeRecord(
-            filename=file.filename or f"resume{ext}",
-            parsed_json=json.dumps(parsed_dict),
-            raw_text=parsed_dict.get("raw_text", ""),
-        )
-        db.add(record)
-        db.flush()  # get the generated ID
+    # Keywords are computed once here and persisted so /analyze and
+    # /optimize never re-tokenize the full resume text.
+    resume_kw = await _run(match_analyzer.extract_resume_keywords, parsed_dict)
 
-        # Store original file
-        file_path = file_storage.save("uploads", record.id, contents, ext=ext)
-        record.file_path = file_path
-        db.commit()
+    # Save to database and file storage
+    record = ResumeRecord(
+        filename=file.filename or f"resume{ext}",
+        parsed_json=parsed_dict,
+        raw_text=parsed_dict.get("raw_text", ""),
+        content_hash=content_hash,
+        keywords=sorted(resume_kw),
+    )
+    db.add(record)
+    db.flush()  # get the generated ID
 
-        resume_id = record.id
-    finally:
-        db.close()
+    # Store original file
+    file_path = await file_storage.save_async("uploads", record.id, contents, ext=ext)
+    record.file_path = file_path
+    db.commit()
 
-    return {"resume_id": resume_id, **parsed_dict}
+    return {"resume_id": record.id, **parsed_dict}
 
 
-@app.post("/ats-check")
+@app.post("/ats-check", response_model=None)
 async def ats_check(
     file: UploadFile | None = File(None),
     resume_id: str | None = Form(None),
+    db: Session = Depends(get_db),
 ):
     """ATS compliance check. Upload a .docx/.pdf or provide a resume_id.
 
@@ -202,10 +337,8 @@ async def ats_check(
     if file and file.filename:
         _get_file_ext(file.filename)
         try:
-            contents = await file.read()
-            if len(contents) > MAX_UPLOAD_SIZE:
-                raise HTTPException(413, "File too large. Maximum size is 20 MB.")
-            parsed = parser.parse_file(contents, file.filename)
+            contents = await _read_upload(file)
+            parsed = await _run(parser.parse_file, contents, file.filename)
             parsed_dict = parsed.to_dict()
         except HTTPException:
             raise
@@ -214,16 +347,16 @@ async def ats_check(
         except Exception as exc:
             raise HTTPException(422, f"Failed to parse the document: {exc}")
     elif resume_id:
-        parsed_dict = _get_resume_data(resume_id, None)
+        parsed_dict = _get_resume_data(db, resume_id, None)
     else:
         raise HTTPException(400, "Provide a .docx/.pdf file or a resume_id.")
 
-    report = ats_optimizer.check(parsed_dict)
+    report = await _run(ats_optimizer.check, parsed_dict)
     return report.to_dict()
 
 
-@app.post("/parse-job")
-async def parse_job(body: JobInput):
+@app.post("/parse-job", response_model=None)
+async def parse_job(body: JobInput, db: Session = Depends(get_db)):
     """Parse a job description from a URL or raw text.
 
     The result is saved and a `job_id` is returned for later use.
@@ -236,9 +369,9 @@ async def parse_job(body: JobInput):
 
     try:
         if body.url:
-            result = job_extractor.from_url(body.url)
+            result = await _run(job_extractor.from_url, body.url)
         else:
-            result = job_extractor.from_text(body.text)
+            result = await _run(job_extractor.from_text, body.text)
     except Exception as exc:
         raise HTTPException(
             status_code=422, detail=f"Failed to extract job description: {exc}"
@@ -247,139 +380,125 @@ async def parse_job(body: JobInput):
     parsed_dict = result.to_dict()
 
     # Save to database
-    db = get_db()
-    try:
-        record = JobRecord(
-            title=parsed_dict.get("title", ""),
-            source_url=body.url or "",
-            parsed_json=json.dumps(parsed_dict),
-        )
-        db.add(record)
-        db.commit()
-        job_id = record.id
-    finally:
-        db.close()
+    record = JobRecord(
+        title=parsed_dict.get("title", ""),
+        source_url=body.url or "",
+        parsed_json=parsed_dict,
+    )
+    db.add(record)
+    db.commit()
 
-    return {"job_id": job_id, **parsed_dict}
+    return {"job_id": record.id, **parsed_dict}
 
 
-@app.post("/analyze")
-async def analyze(body: AnalyzeRequest):
+@app.post("/analyze", response_model=None)
+async def analyze(body: AnalyzeRequest, db: Session = Depends(get_db)):
     """Analyze how well a resume matches a job description.
 
     Accepts resume_id + job_id, or full JSON for both.
     Returns match score, keywords, and recommendations.
     The analysis is saved and an `analysis_id` is returned.
     """
-    resume_data = _get_resume_data(body.resume_id, body.resume)
-    job_data = _get_job_data(body.job_id, body.job)
+    resume_data = _get_resume_data(db, body.resume_id, body.resume)
+    job_data = _get_job_data(db, body.job_id, body.job)
+    resume_kw = (
+        _get_resume_keywords(db, body.resume_id)
+        if body.resume_id and not body.resume
+        else None
+    )
 
+    # Match analysis and ATS check are independent — run them in parallel
     try:
-        match_report = match_analyzer.analyze(resume_data, job_data)
+        match_report, ats_report = await asyncio.gather(
+            _run(match_analyzer.analyze, resume_data, job_data, resume_kw),
+            _run(ats_optimizer.check, resume_data),
+        )
     except Exception as exc:
         raise HTTPException(422, f"Analysis failed: {exc}")
 
-    ats_report = ats_optimizer.check(resume_data)
-
     match_dict = match_report.to_dict()
     ats_dict = ats_report.to_dict()
 
     # Save analysis to database
-    db = get_db()
-    try:
-        record = AnalysisRecord(
-            resume_id=body.resume_id or "",
-            job_id=body.job_id or "",
-            match_report=json.dumps(match_dict),
-            ats_report=json.dumps(ats_dict),
-        )
-        db.add(record)
-        db.commit()
-        analysis_id = record.id
-    finally:
-        db.close()
+    record = AnalysisRecord(
+        resume_id=body.resume_id or "",
+        job_id=body.job_id or "",
+        match_report=match_dict,
+        ats_report=ats_dict,
+    )
+    db.add(record)
+    db.commit()
 
     return {
-        "analysis_id": analysis_id,
+        "analysis_id": record.id,
         "match_report": match_dict,
         "ats_report": ats_dict,
     }
 
 
-@app.post("/update-resume")
-async def update_resume(body: UpdateRequest):
+@app.post("/update-resume", response_model=None)
+async def update_resume(body: UpdateRequest, db: Session = Depends(get_db)):
     """Update resume content to better match the job description.
 
     Provide analysis_id to use saved data, or pass resume + match_report directly.
     """
     if body.analysis_id:
         # Load from saved analysis
-        db = get_db()
-        try:
-            analysis = db.query(AnalysisRecord).filter_by(id=body.analysis_id).first()
-            if not analysis:
-                raise HTTPException(404, f"Analysis '{body.analysis_id}' not found.")
-            resume_data = _get_resume_data(analysis.resume_id or None, body.resume)
-            match_data = json.loads(analysis.match_report)
-            ats_data = json.loads(analysis.ats_report) if analysis.ats_report else None
-        finally:
-            db.close()
+        analysis = db.query(AnalysisRecord).filter_by(id=body.analysis_id).first()
+        if not analysis:
+            raise HTTPException(404, f"Analysis '{body.analysis_id}' not found.")
+        resume_data = _get_resume_data(db, analysis.resume_id or None, body.resume)
+        match_data = analysis.match_report or {}
+        ats_data = analysis.ats_report or None
     else:
-        resume_data = _get_resume_data(body.resume_id, body.resume)
+        resume_data = _get_resume_data(db, body.resume_id, body.resume)
         if not body.match_report:
             raise HTTPException(400, "Provide 'match_report' or 'analysis_id'.")
         match_data = body.match_report
         ats_data = body.ats_report
 
     try:
-        result = resume_updater.update(resume_data, match_data, ats_data)
+        result = await _run(resume_updater.update, resume_data, match_data, ats_data)
     except Exception as exc:
         raise HTTPException(422, f"Update failed: {exc}")
 
     return result.to_dict()
 
 
-@app.post("/generate")
-async def generate(body: GenerateRequest):
+@app.post("/generate", response_model=None)
+async def generate(body: GenerateRequest, db: Session = Depends(get_db)):
     """Generate a .docx file from resume data.
 
     Provide resume JSON, resume_id, or analysis_id.
     Returns a downloadable Word document.
     """
     if body.analysis_id:
-        db = get_db()
-        try:
-            analysis = db.query(AnalysisRecord).filter_by(id=body.analysis_id).first()
-            if not analysis:
-                raise HTTPException(404, f"Analysis '{body.analysis_id}' not found.")
-            if analysis.updated_resume_json and analysis.updated_resume_json != "{}":
-                resume_data = json.loads(analysis.updated_resume_json)
-            else:
-                resume_data = _get_resume_data(analysis.resume_id or None, None)
-        finally:
-            db.close()
+        analysis = db.query(AnalysisRecord).filter_by(id=body.analysis_id).first()
+        if not analysis:
+            raise HTTPException(404, f"Analysis '{body.analysis_id}' not found.")
+        if analysis.updated_resume_json:
+            resume_data = analysis.updated_resume_json
+        else:
+            resume_data = _get_resume_data(db, analysis.resume_id or None, None)
     else:
-        resume_data = _get_resume_data(body.resume_id, body.resume)
+        resume_data = _get_resume_data(db, body.resume_id, body.resume)
 
     try:
-        docx_bytes = resume_generator.generate(resume_data)
+        docx_buffer = await _run(resume_generator.generate_buffer, resume_data)
     except Exception as exc:
         raise HTTPException(422, f"Generation failed: {exc}")
 
-    return Response(
-        content=docx_bytes,
-        media_type="application/vnd.openxmlformats-officedocument.wordprocessingml.document",
-        headers={"Content-Disposition": "attachment; filename=updated_resume.docx"},
-    )
+    return _stream_docx(docx_buffer, "updated_resume.docx")
 
 
-@app.post("/optimize")
+@app.post("/optimize", response_model=None)
 async def optimize(
     file: UploadFile | None = File(None),
     resume_id: str | None = Form(None),
     job_id: str | None = Form(None),
     job_url: str | None = Form(None),
     job_text: str | None = Form(None),
+    db: Session = Depends(get_db),
 ):
     """Full pipeline: get back an optimized .docx.
 
@@ -398,195 +517,252 @@ async def optimize(
     contents: bytes | None = None
     existing_resume_id: str | None = None
     upload_ext: str = ".docx"
+    resume_kw: set[str] | None = None
+
+    content_hash = ""
 
     if file and file.filename:
         upload_ext = _get_file_ext(file.filename)
-        try:
-            contents = await file.read()
-            if len(contents) > MAX_UPLOAD_SIZE:
-                raise HTTPException(413, "File too large. Maximum size is 20 MB.")
-            parsed_resume = parser.parse_file(contents, file.filename)
-            resume_dict = parsed_resume.to_dict()
-        except HTTPException:
-            raise
-        except ValueError as exc:
-            raise HTTPException(422, str(exc))
-        except Exception as exc:
-            raise HTTPException(422, f"Failed to parse resume: {exc}")
+        contents = await _read_upload(file)
+        content_hash = hashlib.sha256(contents).hexdigest()
+        existing = (
+            db.query(ResumeRecord).filter_by(content_hash=content_hash).first()
+        )
+        if existing:
+            # Same bytes already parsed and stored — reuse the record
+            existing_resume_id = existing.id
+            resume_dict = existing.get_parsed()
+            resume_kw = set(existing.keywords) if existing.keywords else None
+            contents = None
+        else:
+            try:
+                parsed_resume = await _run(parser.parse_file, contents, file.filename)
+                resume_dict = parsed_resume.to_dict()
+            except HTTPException:
+                raise
+            except ValueError as exc:
+                raise HTTPException(422, str(exc))
+            except Exception as exc:
+                raise HTTPException(422, f"Failed to parse resume: {exc}")
+            resume_kw = await _run(
+                match_analyzer.extract_resume_keywords, resume_dict
+            )
     elif resume_id:
         existing_resume_id = resume_id
-        resume_dict = _get_resume_data(resume_id, None)
+        resume_dict = _get_resume_data(db, resume_id, None)
+        resume_kw = _get_resume_keywords(db, resume_id)
     else:
         raise HTTPException(400, "Provide a .docx/.pdf file or a resume_id.")
 
-    # ── Resolve job description ─────────────────────────────────
-    existing_job_id: str | None = None
-
-    if job_id:
-        existing_job_id = job_id
-        job_dict = _get_job_data(job_id, None)
-    elif job_url or job_text:
-        try:
-            if job_url:
-                job_result = job_extractor.from_url(job_url)
-            else:
-                job_result = job_extractor.from_text(job_text)
-            job_dict = job_result.to_dict()
-        except Exception as exc:
-            raise HTTPException(422, f"Failed to parse job description: {exc}")
-    else:
+    # ── Resolve job + run ATS check concurrently ────────────────
+    # JD scraping/lookup and the ATS check only share the resume dict,
+    # so they overlap; only the match analysis needs both results.
+    if not (job_id or job_url or job_text):
         raise HTTPException(400, "Provide job_id, job_url, or job_text.")
 
+    existing_job_id: str | None = job_id
+
+    # Re-running a known resume/job pair during iterative tailoring is
+    # common; serve the stored document instead of redoing the pipeline.
+    if existing_resume_id and existing_job_id:
+        hit = db.scalars(
+            select(AnalysisRecord)
+            .filter_by(resume_id=existing_resume_id, job_id=existing_job_id)
+            .order_by(AnalysisRecord.created_at.desc())
+            .limit(1)
+        ).first()
+        if hit and hit.output_file_path:
+            stored = os.path.join(file_storage.base_dir, hit.output_file_path)
+            if os.path.exists(stored):
+                response = FileResponse(
+                    stored,
+                    media_type=DOCX_MEDIA_TYPE,
+                    filename="optimized_resume.docx",
+                )
+                response.headers["X-Resume-Id"] = existing_resume_id
+                response.headers["X-Job-Id"] = existing_job_id
+                response.headers["X-Analysis-Id"] = hit.id
+                return response
+
+    ats_result, job_dict = await asyncio.gather(
+        _run(ats_optimizer.check, resume_dict),
+        _resolve_job(db, job_id, job_url, job_text),
+    )
+
     # ── Run pipeline ────────────────────────────────────────────
-    ats_report = ats_optimizer.check(resume_dict).to_dict()
-    match_report = match_analyzer.analyze(resume_dict, job_dict).to_dict()
-    update_result = resume_updater.update(resume_dict, match_report, ats_report)
+    ats_report = ats_result.to_dict()
+    match_report = (
+        await _run(match_analyzer.analyze, resume_dict, job_dict, resume_kw)
+    ).to_dict()
+    update_result = await _run(resume_updater.update, resume_dict, match_report, ats_report)
+    # Snapshot the result dict once; the generator and the DB row below
+    # share it instead of each triggering their own to_dict() walk.
+    updated_dict = update_result.to_dict()
 
     try:
-        docx_bytes = resume_generator.generate(update_result.to_dict())
+        docx_bytes = await _run(resume_generator.generate, updated_dict)
     except Exception as exc:
         raise HTTPException(422, f"Failed to generate document: {exc}")
 
     # ── Save to database ────────────────────────────────────────
-    db = get_db()
-    try:
-        # Resume: reuse existing or create new
-        if existing_resume_id:
-            rid = existing_resume_id
-        else:
-            resume_rec = ResumeRecord(
-                filename=(file.filename if file else f"resume{upload_ext}"),
-                parsed_json=json.dumps(resume_dict),
-                raw_text=resume_dict.get("raw_text", ""),
-            )
-            db.add(resume_rec)
-            db.flush()
-            if contents:
-                file_storage.save("uploads", resume_rec.id, contents, ext=upload_ext)
-                resume_rec.file_path = f"uploads/{resume_rec.id}{upload_ext}"
-            rid = resume_rec.id
-
-        # Job: reuse existing or create new
-        if existing_job_id:
-            jid = existing_job_id
-        else:
-            job_rec = JobRecord(
-                title=job_dict.get("title", ""),
-                source_url=job_url or "",
-                parsed_json=json.dumps(job_dict),
-            )
-            db.add(job_rec)
-            db.flush()
-            jid = job_rec.id
-
-        # Analysis: always new
-        analysis_rec = AnalysisRecord(
-            resume_id=rid,
-            job_id=jid,
-            match_report=json.dumps(match_report),
-            ats_report=json.dumps(ats_report),
-            updated_resume_json=json.dumps(update_result.to_dict()),
+    # IDs are generated client-side so all inserts land in one flush at
+    # commit time — no per-record flush round trips or extra SQLite
+    # write-lock acquisitions.
+    new_records = []
+
+    # Resume: reuse existing or create new
+    if existing_resume_id:
+        rid = existing_resume_id
+    else:
+        resume_rec = ResumeRecord(
+            id=new_id(),
+            filename=(file.filename if file else f"resume{upload_ext}"),
+            parsed_json=resume_dict,
+            raw_text=resume_dict.get("raw_text", ""),
+            content_hash=content_hash,
+            keywords=sorted(resume_kw) if resume_kw else [],
         )
-        db.add(analysis_rec)
-        db.flush()
+        if contents:
+            await file_storage.save_async(
+                "uploads", resume_rec.id, contents, ext=upload_ext
+            )
+            resume_rec.file_path = f"uploads/{resume_rec.id}{upload_ext}"
+        new_records.append(resume_rec)
+        rid = resume_rec.id
 
-        output_path = file_storage.save("outputs", analysis_rec.id, docx_bytes)
-        analysis_rec.output_file_path = output_path
+    # Job: reuse existing or create new
+    if existing_job_id:
+        jid = existing_job_id
+    else:
+        job_rec = JobRecord(
+            id=new_id(),
+            title=job_dict.get("title", ""),
+            source_url=job_url or "",
+            parsed_json=job_dict,
+        )
+        new_records.append(job_rec)
+        jid = job_rec.id
+
+    # Analysis: always new
+    analysis_rec = AnalysisRecord(
+        id=new_id(),
+        resume_id=rid,
+        job_id=jid,
+        match_report=match_report,
+        ats_report=ats_report,
+        updated_resume_json=updated_dict,
+    )
+    analysis_rec.output_file_path = await file_storage.save_async(
+        "outputs", analysis_rec.id, docx_bytes
+    )
+    new_records.append(analysis_rec)
 
-        db.commit()
-        aid = analysis_rec.id
-    finally:
-        db.close()
+    db.add_all(new_records)
+    db.commit()
+    aid = analysis_rec.id
 
-    return Response(
-        content=docx_bytes,
-        media_type="application/vnd.openxmlformats-officedocument.wordprocessingml.document",
-        headers={
-            "Content-Disposition": "attachment; filename=optimized_resume.docx",
-            "X-Resume-Id": rid,
-            "X-Job-Id": jid,
-            "X-Analysis-Id": aid,
-        },
-    )
+    response = _stream_docx(BytesIO(docx_bytes), "optimized_resume.docx")
+    response.headers["X-Resume-Id"] = rid
+    response.headers["X-Job-Id"] = jid
+    response.headers["X-Analysis-Id"] = aid
+    return response
 
 
 # ── Listing endpoints ───────────────────────────────────────────
 
 
-@app.get("/resumes")
-async def list_resumes():
-    """List all saved resumes."""
-    db = get_db()
-    try:
-        records = db.query(ResumeRecord).order_by(ResumeRecord.created_at.desc()).all()
-        return [r.to_summary() for r in records]
-    finally:
-        db.close()
+@app.get("/resumes", response_model=None)
+async def list_resumes(
+    limit: int = 50, offset: int = 0, db: Session = Depends(get_db)
+):
+    """List saved resumes (most recent first, paginated)."""
+    stmt = (
+        select(ResumeRecord)
+        # Summaries never touch the big blobs — don't read them off disk
+        .options(defer(ResumeRecord.parsed_json), defer(ResumeRecord.raw_text))
+        .order_by(ResumeRecord.created_at.desc())
+        .limit(limit)
+        .offset(offset)
+    )
+    return [r.to_summary() for r in db.scalars(stmt)]
 
 
-@app.get("/resumes/{resume_id}")
-async def get_resume(resume_id: str):
+@app.get("/resumes/{resume_id}", response_model=None)
+async def get_resume(resume_id: str, db: Session = Depends(get_db)):
     """Get a saved resume by ID."""
-    db = get_db()
-    try:
-        record = db.query(ResumeRecord).filter_by(id=resume_id).first()
-        if not record:
-            raise HTTPException(404, f"Resume '{resume_id}' not found.")
-        return {"resume_id": record.id, **record.get_parsed()}
-    finally:
-        db.close()
+    record = db.query(ResumeRecord).filter_by(id=resume_id).first()
+    if not record:
+        raise HTTPException(404, f"Resume '{resume_id}' not found.")
+    return {"resume_id": record.id, **record.get_parsed()}
 
 
-@app.get("/jobs")
-async def list_jobs():
-    """List all saved job descriptions."""
-    db = get_db()
-    try:
-        records = db.query(JobRecord).order_by(JobRecord.created_at.desc()).all()
-        return [r.to_summary() for r in records]
-    finally:
-        db.close()
+@app.get("/jobs", response_model=None)
+async def list_jobs(
+    limit: int = 50, offset: int = 0, db: Session = Depends(get_db)
+):
+    """List saved job descriptions (most recent first, paginated)."""
+    stmt = (
+        select(JobRecord)
+        .options(defer(JobRecord.parsed_json))
+        .order_by(JobRecord.created_at.desc())
+        .limit(limit)
+        .offset(offset)
+    )
+    return [r.to_summary() for r in db.scalars(stmt)]
 
 
-@app.get("/jobs/{job_id}")
-async def get_job(job_id: str):
+@app.get("/jobs/{job_id}", response_model=None)
+async def get_job(job_id: str, db: Session = Depends(get_db)):
     """Get a saved job description by ID."""
-    db = get_db()
-    try:
-        record = db.query(JobRecord).filter_by(id=job_id).first()
-        if not record:
-            raise HTTPException(404, f"Job '{job_id}' not found.")
-        return {"job_id": record.id, **record.get_parsed()}
-    finally:
-        db.close()
-
-
-@app.get("/analyses")
-async def list_analyses():
-    """List all saved analyses."""
-    db = get_db()
-    try:
-        records = db.query(AnalysisRecord).order_by(AnalysisRecord.created_at.desc()).all()
-        return [r.to_summary() for r in records]
-    finally:
-        db.close()
+    record = db.query(JobRecord).filter_by(id=job_id).first()
+    if not record:
+        raise HTTPException(404, f"Job '{job_id}' not found.")
+    return {"job_id": record.id, **record.get_parsed()}
 
 
-@app.get("/analyses/{analysis_id}")
-async def get_analysis(analysis_id: str):
-    """Get a saved analysis with full match report."""
-    db = get_db()
-    try:
-        record = db.query(AnalysisRecord).filter_by(id=analysis_id).first()
-        if not record:
-            raise HTTPException(404, f"Analysis '{analysis_id}' not found.")
-        return {
-            "analysis_id": record.id,
-            "resume_id": record.resume_id,
-            "job_id": record.job_id,
-            "match_report": json.loads(record.match_report) if record.match_report else {},
-            "ats_report": json.loads(record.ats_report) if record.ats_report else {},
-            "created_at": record.created_at.isoformat() if record.created_at else None,
-        }
-    finally:
-        db.close()
+@app.get("/analyses", response_model=None)
+async def list_analyses(
+    limit: int = 50, offset: int = 0, db: Session = Depends(get_db)
+):
+    """List saved analyses (most recent first, paginated)."""
+    stmt = (
+        select(AnalysisRecord)
+        # to_summary only needs match_report for the overall score
+        .options(
+            defer(AnalysisRecord.ats_report),
+            defer(AnalysisRecord.updated_resume_json),
+        )
+        .order_by(AnalysisRecord.created_at.desc())
+        .limit(limit)
+        .offset(offset)
+    )
+    return [r.to_summary() for r in db.scalars(stmt)]
+
+
+@app.get("/analyses/{analysis_id}", response_model=None)
+async def get_analysis(analysis_id: str, db: Session = Depends(get_db)):
+    """Get a saved analysis with full match report and linked summaries."""
+    # Eager-load the linked resume/job in the same round trip (minus
+    # their heavy parsed blobs) so the UI's "analysis + inputs" view
+    # doesn't need two follow-up requests.
+    stmt = (
+        select(AnalysisRecord)
+        .options(
+            selectinload(AnalysisRecord.resume).defer(ResumeRecord.parsed_json),
+            selectinload(AnalysisRecord.job).defer(JobRecord.parsed_json),
+        )
+        .filter_by(id=analysis_id)
+    )
+    record = db.scalars(stmt).one_or_none()
+    if not record:
+        raise HTTPException(404, f"Analysis '{analysis_id}' not found.")
+    return {
+        "analysis_id": record.id,
+        "resume_id": record.resume_id,
+        "job_id": record.job_id,
+        "resume": record.resume.to_summary() if record.resume else None,
+        "job": record.job.to_summary() if record.job else None,
+        "match_report": record.match_report or {},
+        "ats_report": record.ats_report or {},
+        "created_at": record.created_at.isoformat() if record.created_at else None,
+    }
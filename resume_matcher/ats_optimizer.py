@@ -2,6 +2,8 @@
 
 from __future__ import annotations
 
+import re
+from collections import deque
 from dataclasses import dataclass, field
 
 # Standard ATS-friendly section headings
@@ -36,8 +38,27 @@ HEADING_RENAMES: dict[str, str] = {
     "Qualifications": "Education",
 }
 
+# Lowercased lookup table so heading checks are one dict probe instead
+# of a linear scan over HEADING_RENAMES with per-iteration .lower()
+_HEADING_RENAMES_LOWER = {k.lower(): v for k, v in HEADING_RENAMES.items()}
 
-@dataclass
+# Compiled once at import; these run per-line in the hot checks below
+_PHONE_RE = re.compile(r"\(?\d{3}\)?[\s\-.]?\d{3}[\s\-.]?\d{4}")
+_METRIC_RE = re.compile(r"\d+[%+]?")
+_SKILL_SEP_RE = re.compile(r"[;,]")
+
+# Single alternation anchored at line start — one C-level scan per
+# bullet instead of strip/split/lower tokenization just to read word 0
+_ACTION_VERB_RE = re.compile(
+    r"^\s*(?:led|managed|developed|built|designed|implemented|created"
+    r"|improved|reduced|increased|delivered|launched|optimized"
+    r"|established|achieved|drove|spearheaded|orchestrated|streamlined"
+    r"|mentored)\b",
+    re.IGNORECASE,
+)
+
+
+@dataclass(slots=True, frozen=True)
 class ATSIssue:
     """A single ATS compliance issue."""
 
@@ -47,12 +68,13 @@ class ATSIssue:
     suggestion: str = ""
 
 
-@dataclass
+@dataclass(slots=True)
 class ATSReport:
     """Full ATS compliance report."""
 
     score: int = 100  # 0-100
-    issues: list[ATSIssue] = field(default_factory=list)
+    # deque: O(1) appends with no capacity-doubling; only ever iterated
+    issues: deque[ATSIssue] = field(default_factory=deque)
     section_status: dict[str, str] = field(default_factory=dict)
     heading_suggestions: dict[str, str] = field(default_factory=dict)
 
@@ -73,6 +95,60 @@ class ATSReport:
         }
 
 
+# The fixed section checks always produce the same issue objects, so
+# they are built once at import and shared across reports (ATSIssue
+# instances are never mutated after creation)
+_REQUIRED_SECTION_ISSUES = {
+    section: ATSIssue(
+        severity="error",
+        category="structure",
+        message=f"Missing required section: {section}",
+        suggestion=f"Add a '{section.title()}' section to your resume.",
+    )
+    for section in REQUIRED_SECTIONS
+}
+_RECOMMENDED_SECTION_ISSUES = {
+    section: ATSIssue(
+        severity="info",
+        category="structure",
+        message=f"Optional section not found: {section}",
+        suggestion=f"Consider adding a '{section.title()}' section.",
+    )
+    for section in RECOMMENDED_SECTIONS
+}
+
+_NO_CONTACT_ISSUE = ATSIssue(
+    severity="error",
+    category="content",
+    message="No contact information found at the top of the resume.",
+    suggestion="Add your name, email, phone, and location at the top.",
+)
+_NO_EMAIL_ISSUE = ATSIssue(
+    severity="warning",
+    category="content",
+    message="No email address detected in contact section.",
+    suggestion="Add a professional email address.",
+)
+_NO_PHONE_ISSUE = ATSIssue(
+    severity="warning",
+    category="content",
+    message="No phone number detected in contact section.",
+    suggestion="Add a phone number.",
+)
+_NO_METRICS_ISSUE = ATSIssue(
+    severity="warning",
+    category="content",
+    message="No quantifiable achievements found in experience.",
+    suggestion="Add metrics (e.g., 'Increased sales by 25%', 'Managed team of 10').",
+)
+_NO_ACTION_VERB_ISSUE = ATSIssue(
+    severity="info",
+    category="content",
+    message="Bullet points may not start with strong action verbs.",
+    suggestion="Start bullet points with action verbs like 'Led', 'Developed', 'Implemented'.",
+)
+
+
 class ATSOptimizer:
     """Analyzes a parsed resume for ATS compliance."""
 
@@ -90,10 +166,12 @@ class ATSOptimizer:
 
         self._check_required_sections(sections, report)
         self._check_section_headings(sections, report)
-        self._check_contact_info(sections, report)
-        self._check_experience_content(sections, report)
-        self._check_skills_content(sections, report)
-        self._check_summary_content(sections, report)
+        # The content checks only need their own section, so the
+        # lookups happen once here rather than inside each method
+        self._check_contact_info(sections.get("header", {}), report)
+        self._check_experience_content(sections.get("experience", {}), report)
+        self._check_skills_content(sections.get("skills", {}), report)
+        self._check_summary_content(sections.get("summary", {}), report)
 
         # Clamp score
         report.score = max(0, min(100, report.score))
@@ -109,28 +187,14 @@ class ATSOptimizer:
             else:
                 report.section_status[section] = "missing"
                 report.score -= 15
-                report.issues.append(
-                    ATSIssue(
-                        severity="error",
-                        category="structure",
-                        message=f"Missing required section: {section}",
-                        suggestion=f"Add a '{section.title()}' section to your resume.",
-                    )
-                )
+                report.issues.append(_REQUIRED_SECTION_ISSUES[section])
 
         for section in RECOMMENDED_SECTIONS:
             if section in sections:
                 report.section_status[section] = "present"
             else:
                 report.section_status[section] = "optional-missing"
-                report.issues.append(
-                    ATSIssue(
-                        severity="info",
-                        category="structure",
-                        message=f"Optional section not found: {section}",
-                        suggestion=f"Consider adding a '{section.title()}' section.",
-                    )
-                )
+                report.issues.append(_RECOMMENDED_SECTION_ISSUES[section])
 
     def _check_section_headings(
         self, sections: dict, report: ATSReport
@@ -142,136 +206,82 @@ class ATSOptimizer:
                 continue
 
             # Check if heading should be renamed
-            for old_name, new_name in HEADING_RENAMES.items():
-                if heading.lower() == old_name.lower():
-                    report.heading_suggestions[heading] = new_name
-                    report.score -= 5
-                    report.issues.append(
-                        ATSIssue(
-                            severity="warning",
-                            category="heading",
-                            message=f"Non-standard heading: '{heading}'",
-                            suggestion=f"Rename to '{new_name}' for better ATS parsing.",
-                        )
+            new_name = _HEADING_RENAMES_LOWER.get(heading.lower())
+            if new_name:
+                report.heading_suggestions[heading] = new_name
+                report.score -= 5
+                report.issues.append(
+                    ATSIssue(
+                        severity="warning",
+                        category="heading",
+                        message=f"Non-standard heading: '{heading}'",
+                        suggestion=f"Rename to '{new_name}' for better ATS parsing.",
                     )
-                    break
+                )
 
     def _check_contact_info(
-        self, sections: dict, report: ATSReport
+        self, header: dict, report: ATSReport
     ) -> None:
         """Check that contact information is present and complete."""
-        header = sections.get("header", {})
         content = header.get("content", [])
         full_text = " ".join(content).lower()
 
         if not content:
             report.score -= 10
-            report.issues.append(
-                ATSIssue(
-                    severity="error",
-                    category="content",
-                    message="No contact information found at the top of the resume.",
-                    suggestion="Add your name, email, phone, and location at the top.",
-                )
-            )
+            report.issues.append(_NO_CONTACT_ISSUE)
             return
 
         # Check for email
         if "@" not in full_text:
             report.score -= 5
-            report.issues.append(
-                ATSIssue(
-                    severity="warning",
-                    category="content",
-                    message="No email address detected in contact section.",
-                    suggestion="Add a professional email address.",
-                )
-            )
+            report.issues.append(_NO_EMAIL_ISSUE)
 
         # Check for phone
-        import re
-
-        if not re.search(r"\(?\d{3}\)?[\s\-.]?\d{3}[\s\-.]?\d{4}", full_text):
+        if not _PHONE_RE.search(full_text):
             report.score -= 3
-            report.issues.append(
-                ATSIssue(
-                    severity="warning",
-                    category="content",
-                    message="No phone number detected in contact section.",
-                    suggestion="Add a phone number.",
-                )
-            )
+            report.issues.append(_NO_PHONE_ISSUE)
 
     def _check_experience_content(
-        self, sections: dict, report: ATSReport
+        self, experience: dict, report: ATSReport
     ) -> None:
         """Check quality of experience section."""
-        experience = sections.get("experience", {})
         content = experience.get("content", [])
 
         if not content:
             return
 
-        # Check for quantifiable achievements (numbers/percentages)
-        has_metrics = False
+        # Single fused pass: check quantifiable achievements and action
+        # verbs together so long experience sections are walked once
+        has_metrics = has_action_verbs = False
         for line in content:
-            import re
-
-            if re.search(r"\d+[%+]?", line):
+            if not has_metrics and _METRIC_RE.search(line):
                 has_metrics = True
+            if not has_action_verbs and _ACTION_VERB_RE.match(line):
+                has_action_verbs = True
+            if has_metrics and has_action_verbs:
                 break
 
         if not has_metrics:
             report.score -= 5
-            report.issues.append(
-                ATSIssue(
-                    severity="warning",
-                    category="content",
-                    message="No quantifiable achievements found in experience.",
-                    suggestion="Add metrics (e.g., 'Increased sales by 25%', 'Managed team of 10').",
-                )
-            )
-
-        # Check for action verbs
-        action_verbs = {
-            "led", "managed", "developed", "built", "designed", "implemented",
-            "created", "improved", "reduced", "increased", "delivered",
-            "launched", "optimized", "established", "achieved", "drove",
-            "spearheaded", "orchestrated", "streamlined", "mentored",
-        }
-        has_action_verbs = False
-        for line in content:
-            first_word = line.strip().split()[0].lower() if line.strip() else ""
-            if first_word in action_verbs:
-                has_action_verbs = True
-                break
+            report.issues.append(_NO_METRICS_ISSUE)
 
         if not has_action_verbs:
             report.score -= 3
-            report.issues.append(
-                ATSIssue(
-                    severity="info",
-                    category="content",
-                    message="Bullet points may not start with strong action verbs.",
-                    suggestion="Start bullet points with action verbs like 'Led', 'Developed', 'Implemented'.",
-                )
-            )
+            report.issues.append(_NO_ACTION_VERB_ISSUE)
 
     def _check_skills_content(
-        self, sections: dict, report: ATSReport
+        self, skills: dict, report: ATSReport
     ) -> None:
         """Check quality of skills section."""
-        skills = sections.get("skills", {})
         content = skills.get("content", [])
 
         if not content:
             return
 
-        # Count approximate number of skills
+        # Count approximate number of skills — one split, no normalized
+        # copy of the text or intermediate stripped list
         full_text = " ".join(content)
-        skill_count = len(
-            [s.strip() for s in full_text.replace(";", ",").split(",") if s.strip()]
-        )
+        skill_count = sum(1 for s in _SKILL_SEP_RE.split(full_text) if s.strip())
 
         if skill_count < 5:
             report.score -= 5
@@ -285,17 +295,16 @@ class ATSOptimizer:
             )
 
     def _check_summary_content(
-        self, sections: dict, report: ATSReport
+        self, summary: dict, report: ATSReport
     ) -> None:
         """Check quality of summary section."""
-        summary = sections.get("summary", {})
         content = summary.get("content", [])
 
         if not content:
             return
 
-        full_text = " ".join(content)
-        word_count = len(full_text.split())
+        # Sum per-line word counts; no joined copy of the summary needed
+        word_count = sum(len(line.split()) for line in content)
 
         if word_count < 15:
             report.score -= 3
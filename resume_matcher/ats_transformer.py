@@ -5,17 +5,26 @@ This produces the "core base" resume that all subsequent operations build on.
 
 from __future__ import annotations
 
-import json
+import orjson
 import logging
 from dataclasses import dataclass, field
 
-from resume_matcher.llm_client import get_llm_client
+from resume_matcher.llm_client import LLMClient, get_llm_client
 from resume_matcher.prompts import ATS_TRANSFORM_SYSTEM, ATS_TRANSFORM_USER
 
 logger = logging.getLogger(__name__)
 
+# The transform prompt is split around its placeholder once, so each
+# call joins three strings instead of re-scanning the template with
+# str.format on a payload that is mostly the resume JSON itself.
+# The {{ }} escapes str.format would have unescaped are applied here.
+_PROMPT_PREFIX, _PROMPT_SUFFIX = (
+    part.replace("{{", "{").replace("}}", "}")
+    for part in ATS_TRANSFORM_USER.split("{resume_json}")
+)
 
-@dataclass
+
+@dataclass(slots=True)
 class ATSTransformResult:
     """Result of ATS transformation."""
 
@@ -36,6 +45,17 @@ class ATSTransformResult:
 class ATSTransformer:
     """Transforms a parsed resume into ATS-standard format using LLM."""
 
+    def __init__(self) -> None:
+        self._client: LLMClient | None = None
+        self._optimizer = None
+
+    @property
+    def client(self) -> LLMClient:
+        """LLM client, constructed on first use and reused afterwards."""
+        if self._client is None:
+            self._client = get_llm_client()
+        return self._client
+
     def transform(self, parsed_resume: dict) -> ATSTransformResult:
         """Transform a parsed resume into ATS-standard format.
 
@@ -48,19 +68,20 @@ class ATSTransformer:
         from resume_matcher.ats_optimizer import ATSOptimizer
 
         result = ATSTransformResult()
-        optimizer = ATSOptimizer()
+        if self._optimizer is None:
+            self._optimizer = ATSOptimizer()
+        optimizer = self._optimizer
 
         # Score the original resume
         original_report = optimizer.check(parsed_resume)
         result.original_score = original_report.score
 
         # Call LLM to transform
-        resume_json = json.dumps(parsed_resume, indent=2)
-        prompt = ATS_TRANSFORM_USER.format(resume_json=resume_json)
+        resume_json = orjson.dumps(parsed_resume, option=orjson.OPT_INDENT_2).decode()
+        prompt = _PROMPT_PREFIX + resume_json + _PROMPT_SUFFIX
 
         try:
-            client = get_llm_client()
-            transformed = client.complete_json(ATS_TRANSFORM_SYSTEM, prompt)
+            transformed = self.client.complete_json(ATS_TRANSFORM_SYSTEM, prompt)
         except Exception as exc:
             logger.error("LLM ATS transformation failed: %s", exc)
             raise ValueError(f"ATS transformation failed: {exc}") from exc
@@ -74,9 +95,15 @@ class ATSTransformer:
         # Safety check: verify all companies, titles, dates are preserved
         self._validate_preservation(parsed_resume, transformed)
 
-        # Score the transformed resume
-        transformed_report = optimizer.check(transformed)
-        result.transformed_score = transformed_report.score
+        # Score the transformed resume. When the LLM returns the resume
+        # unchanged the original report already is the answer — comparing
+        # dicts is far cheaper than a full re-check. (Key-set hashing
+        # would be cheaper still but wrongly equates resumes whose
+        # content differs within the same sections.)
+        if transformed == parsed_resume:
+            result.transformed_score = original_report.score
+        else:
+            result.transformed_score = optimizer.check(transformed).score
 
         # Diff to find changes
         result.changes_made = self._diff_changes(parsed_resume, transformed)
@@ -102,10 +129,16 @@ class ATSTransformer:
         trans_entries = trans_exp.get("entries", [])
 
         if orig_entries and trans_entries:
-            orig_companies = {e.get("company", "").lower() for e in orig_entries}
-            trans_companies = {e.get("company", "").lower() for e in trans_entries}
-
-            missing = orig_companies - trans_companies
+            # casefold once per entry; skip empty names so a missing
+            # "company" key can't mask a real omission via ""
+            trans_companies = frozenset(
+                e.get("company", "").casefold() for e in trans_entries
+            )
+            missing = {
+                name
+                for name in (e.get("company", "").casefold() for e in orig_entries)
+                if name and name not in trans_companies
+            }
             if missing:
                 logger.warning(
                     "LLM dropped companies from resume: %s. Falling back.",
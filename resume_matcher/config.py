@@ -28,6 +28,7 @@ class Settings(BaseSettings):
     llm_temperature: float = 0.2  # low for deterministic output
     llm_max_tokens: int = 4096
     llm_timeout: int = 60  # seconds
+    llm_cache_enabled: bool = False  # cache responses on disk by prompt hash
 
     model_config = {"env_file": ".env", "env_file_encoding": "utf-8"}
 
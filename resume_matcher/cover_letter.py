@@ -2,22 +2,37 @@
 
 from __future__ import annotations
 
-import json
 import logging
 from dataclasses import dataclass, field
 from io import BytesIO
+from typing import BinaryIO
 
+import orjson
 from docx import Document
 from docx.enum.text import WD_ALIGN_PARAGRAPH
 from docx.shared import Inches, Pt, RGBColor
 
-from resume_matcher.llm_client import get_llm_client
-from resume_matcher.prompts import COVER_LETTER_SYSTEM, COVER_LETTER_USER
+from resume_matcher.llm_client import LLMClient, get_llm_client
+from resume_matcher.prompts import (
+    COVER_LETTER_SYSTEM,
+    COVER_LETTER_USER,
+    compact_job_for_prompt,
+    compact_resume_for_prompt,
+)
 
 logger = logging.getLogger(__name__)
 
+# Shared unit/color objects — python-docx constructs these through EMU
+# conversion, so build them once instead of per call
+_ONE_INCH = Inches(1)
+_PT_6 = Pt(6)
+_PT_8 = Pt(8)
+_PT_11 = Pt(11)
+_PT_14 = Pt(14)
+_BODY_COLOR = RGBColor(0x33, 0x33, 0x33)
 
-@dataclass
+
+@dataclass(slots=True)
 class CoverLetterResult:
     """Result of cover letter generation."""
 
@@ -36,6 +51,19 @@ class CoverLetterResult:
 class CoverLetterGenerator:
     """Generates cover letters using LLM and renders them as .docx."""
 
+    # Empty document with margins + Normal style applied, cached as bytes
+    _template_bytes: bytes | None = None
+
+    def __init__(self) -> None:
+        self._client: LLMClient | None = None
+
+    @property
+    def client(self) -> LLMClient:
+        """LLM client, constructed on first use and reused afterwards."""
+        if self._client is None:
+            self._client = get_llm_client()
+        return self._client
+
     def generate(self, resume_data: dict, job_data: dict) -> CoverLetterResult:
         """Generate a cover letter for a specific job application.
 
@@ -46,14 +74,14 @@ class CoverLetterGenerator:
         Returns:
             CoverLetterResult with text, paragraphs, and word count.
         """
-        client = get_llm_client()
-
+        # Structured pruning instead of byte-slicing: the model gets
+        # valid JSON and we never serialize the parts we throw away
         prompt = COVER_LETTER_USER.format(
-            resume_json=json.dumps(resume_data, indent=2)[:6000],
-            job_json=json.dumps(job_data, indent=2)[:4000],
+            resume_json=orjson.dumps(compact_resume_for_prompt(resume_data)).decode(),
+            job_json=orjson.dumps(compact_job_for_prompt(job_data)).decode(),
         )
 
-        data = client.complete_json(COVER_LETTER_SYSTEM, prompt)
+        data = self.client.complete_json(COVER_LETTER_SYSTEM, prompt)
 
         result = CoverLetterResult()
         result.text = data.get("cover_letter_text", "")
@@ -71,7 +99,8 @@ class CoverLetterGenerator:
         candidate_name: str = "",
         company_name: str = "",
         job_title: str = "",
-    ) -> bytes:
+        out: BinaryIO | None = None,
+    ) -> bytes | None:
         """Render a cover letter as a formatted .docx file.
 
         Args:
@@ -79,26 +108,13 @@ class CoverLetterGenerator:
             candidate_name: Candidate's full name (for header/closing)
             company_name: Target company name
             job_title: Target job title
+            out: Optional binary stream to write into; saves a full
+                in-memory copy when the caller streams the document.
 
         Returns:
-            Bytes of the .docx file.
+            Bytes of the .docx file, or None when `out` is given.
         """
-        doc = Document()
-
-        # Set margins
-        for section in doc.sections:
-            section.top_margin = Inches(1)
-            section.bottom_margin = Inches(1)
-            section.left_margin = Inches(1)
-            section.right_margin = Inches(1)
-
-        # Default font
-        style = doc.styles["Normal"]
-        font = style.font
-        font.name = "Calibri"
-        font.size = Pt(11)
-        font.color.rgb = RGBColor(0x33, 0x33, 0x33)
-        style.paragraph_format.space_after = Pt(6)
+        doc = self._styled_document()
 
         # Candidate name header
         if candidate_name:
@@ -106,7 +122,7 @@ class CoverLetterGenerator:
             name_para.alignment = WD_ALIGN_PARAGRAPH.LEFT
             run = name_para.add_run(candidate_name)
             run.bold = True
-            run.font.size = Pt(14)
+            run.font.size = _PT_14
 
         # Date
         from datetime import date
@@ -125,7 +141,7 @@ class CoverLetterGenerator:
         for para_text in paragraphs:
             if para_text.strip():
                 para = doc.add_paragraph(para_text.strip())
-                para.paragraph_format.space_after = Pt(8)
+                para.paragraph_format.space_after = _PT_8
 
         # Closing
         doc.add_paragraph("Sincerely,")
@@ -134,8 +150,37 @@ class CoverLetterGenerator:
             run = closing.add_run(candidate_name)
             run.bold = True
 
-        # Write to bytes
+        # Write out — directly to the caller's stream when provided,
+        # otherwise via getvalue() which avoids the seek+read second copy
+        if out is not None:
+            doc.save(out)
+            return None
         buffer = BytesIO()
         doc.save(buffer)
-        buffer.seek(0)
-        return buffer.read()
+        return buffer.getvalue()
+
+    def _styled_document(self) -> Document:
+        """Return a fresh document with margins and base style applied.
+
+        The styled empty document is built once and cached as bytes;
+        subsequent calls reopen it, skipping the margin/font setup API
+        calls that otherwise dominate bulk generation.
+        """
+        cls = type(self)
+        if cls._template_bytes is None:
+            doc = Document()
+            for section in doc.sections:
+                section.top_margin = _ONE_INCH
+                section.bottom_margin = _ONE_INCH
+                section.left_margin = _ONE_INCH
+                section.right_margin = _ONE_INCH
+            style = doc.styles["Normal"]
+            font = style.font
+            font.name = "Calibri"
+            font.size = _PT_11
+            font.color.rgb = _BODY_COLOR
+            style.paragraph_format.space_after = _PT_6
+            buffer = BytesIO()
+            doc.save(buffer)
+            cls._template_bytes = buffer.getvalue()
+        return Document(BytesIO(cls._template_bytes))
@@ -5,20 +5,29 @@ Uses SQLite locally. Swap the DATABASE_URL to PostgreSQL for production.
 
 from __future__ import annotations
 
-import json
 import os
 from datetime import datetime, timezone
+from typing import Iterator
 from uuid import uuid4
 
+import orjson
+import zstandard
 from sqlalchemy import (
     Column,
+    event,
     DateTime,
+    Index,
     ForeignKey,
+    Integer,
+    LargeBinary,
     String,
     Text,
     create_engine,
+    func,
 )
 from sqlalchemy.orm import DeclarativeBase, Session, relationship, sessionmaker
+from sqlalchemy.pool import StaticPool
+from sqlalchemy.types import TypeDecorator
 
 # ── Configuration ───────────────────────────────────────────────
 
@@ -30,13 +39,45 @@ DATABASE_URL = os.environ.get(
     f"sqlite:///{os.path.join(DATA_DIR, 'resume_matcher.db')}",
 )
 
+_pool_kwargs = (
+    # In-memory SQLite must share one connection — every pooled
+    # connection would otherwise see its own empty database.
+    {"poolclass": StaticPool}
+    if DATABASE_URL.endswith(":memory:")
+    # Keep a pool of warm connections instead of reconnecting per request
+    else {
+        "pool_size": 20,
+        "max_overflow": 10,
+        "pool_pre_ping": True,
+        "pool_recycle": 1800,
+    }
+)
+
 engine = create_engine(
     DATABASE_URL,
     # SQLite needs check_same_thread=False for FastAPI
     connect_args={"check_same_thread": False} if "sqlite" in DATABASE_URL else {},
     echo=False,
+    **_pool_kwargs,
 )
 
+if DATABASE_URL.startswith("sqlite"):
+
+    @event.listens_for(engine, "connect")
+    def _set_sqlite_pragmas(dbapi_connection, connection_record) -> None:
+        """Tune each pooled SQLite connection for concurrent API traffic.
+
+        WAL lets readers proceed during writes, and NORMAL synchronous
+        drops the per-commit fsync that dominates /optimize's DB writes.
+        """
+        cursor = dbapi_connection.cursor()
+        cursor.execute("PRAGMA journal_mode=WAL")
+        cursor.execute("PRAGMA synchronous=NORMAL")
+        cursor.execute("PRAGMA mmap_size=268435456")
+        cursor.execute("PRAGMA temp_store=MEMORY")
+        cursor.close()
+
+
 SessionLocal = sessionmaker(bind=engine)
 
 
@@ -50,7 +91,8 @@ class Base(DeclarativeBase):
 # ── Helpers ─────────────────────────────────────────────────────
 
 
-def _new_id() -> str:
+def new_id() -> str:
+    """Generate a short record ID client-side (no DB round trip needed)."""
     return uuid4().hex[:12]
 
 
@@ -58,6 +100,34 @@ def _utcnow() -> datetime:
     return datetime.now(timezone.utc)
 
 
+class CompressedJSON(TypeDecorator):
+    """A dict stored as a zstd-compressed JSON blob.
+
+    Parsed resume/job JSON is verbose and compresses 5-10x, so blobs cut
+    both DB size and SQLite page reads. Values bind and load as plain
+    dicts; the orjson+zstd round trip happens inside the driver layer.
+
+    This intentionally sits where a native JSON/JSONB column would: the
+    models only ever read these blobs whole (no server-side filtering on
+    JSON paths), so the compression win beats JSON1/JSONB pushdown. If a
+    query ever needs to filter on a field like overall_score, promote it
+    to its own indexed column rather than switching this type.
+    """
+
+    impl = LargeBinary
+    cache_ok = True
+
+    def process_bind_param(self, value, dialect):
+        if value is None:
+            return None
+        return zstandard.compress(orjson.dumps(value), level=3)
+
+    def process_result_value(self, value, dialect):
+        if value is None:
+            return None
+        return orjson.loads(zstandard.decompress(value))
+
+
 # ── Models ──────────────────────────────────────────────────────
 
 
@@ -66,17 +136,24 @@ class ResumeRecord(Base):
 
     __tablename__ = "resumes"
 
-    id = Column(String(12), primary_key=True, default=_new_id)
-    filename = Column(String(255), nullable=False)
-    parsed_json = Column(Text, nullable=False)  # JSON string
+    # Integer surrogate PK maps onto SQLite's rowid; the short hex `id`
+    # stays the external identifier exposed through the API.
+    pk = Column(Integer, primary_key=True, autoincrement=True)
+    id = Column(String(12), unique=True, nullable=False, default=new_id)
+    filename = Column(String(255), nullable=False, index=True)
+    parsed_json = Column(CompressedJSON, nullable=False)
     raw_text = Column(Text, default="")
     file_path = Column(String(500), default="")  # path to stored .docx
-    created_at = Column(DateTime, default=_utcnow)
+    content_hash = Column(String(64), default="", index=True)  # sha256 of upload
+    keywords = Column(CompressedJSON, default=list)  # precomputed match keywords
+    created_at = Column(DateTime, default=_utcnow, server_default=func.now())
 
     analyses = relationship("AnalysisRecord", back_populates="resume")
 
     def get_parsed(self) -> dict:
-        return json.loads(self.parsed_json)
+        # The column type decodes once per instance; SQLAlchemy caches
+        # the resulting dict, so repeat reads are free.
+        return self.parsed_json or {}
 
     def to_summary(self) -> dict:
         return {
@@ -91,16 +168,17 @@ class JobRecord(Base):
 
     __tablename__ = "jobs"
 
-    id = Column(String(12), primary_key=True, default=_new_id)
-    title = Column(String(500), default="")
+    pk = Column(Integer, primary_key=True, autoincrement=True)
+    id = Column(String(12), unique=True, nullable=False, default=new_id)
+    title = Column(String(500), default="", index=True)
     source_url = Column(String(2000), default="")
-    parsed_json = Column(Text, nullable=False)  # JSON string
-    created_at = Column(DateTime, default=_utcnow)
+    parsed_json = Column(CompressedJSON, nullable=False)
+    created_at = Column(DateTime, default=_utcnow, server_default=func.now())
 
     analyses = relationship("AnalysisRecord", back_populates="job")
 
     def get_parsed(self) -> dict:
-        return json.loads(self.parsed_json)
+        return self.parsed_json or {}
 
     def to_summary(self) -> dict:
         return {
@@ -115,21 +193,29 @@ class AnalysisRecord(Base):
     """A match analysis linking a resume to a job description."""
 
     __tablename__ = "analyses"
-
-    id = Column(String(12), primary_key=True, default=_new_id)
+    # The pair index (with created_at) serves both the repeat-/optimize
+    # lookup and "analyses for this resume, newest first"; the job index
+    # covers the same listing from the job side.
+    __table_args__ = (
+        Index("ix_analyses_resume_job", "resume_id", "job_id", "created_at"),
+        Index("ix_analyses_job", "job_id", "created_at"),
+    )
+
+    pk = Column(Integer, primary_key=True, autoincrement=True)
+    id = Column(String(12), unique=True, nullable=False, default=new_id)
     resume_id = Column(String(12), ForeignKey("resumes.id"), nullable=False)
     job_id = Column(String(12), ForeignKey("jobs.id"), nullable=False)
-    match_report = Column(Text, default="{}")  # JSON string
-    ats_report = Column(Text, default="{}")  # JSON string
-    updated_resume_json = Column(Text, default="{}")  # JSON string
+    match_report = Column(CompressedJSON, default=dict)
+    ats_report = Column(CompressedJSON, default=dict)
+    updated_resume_json = Column(CompressedJSON, default=dict)
     output_file_path = Column(String(500), default="")
-    created_at = Column(DateTime, default=_utcnow)
+    created_at = Column(DateTime, default=_utcnow, server_default=func.now())
 
     resume = relationship("ResumeRecord", back_populates="analyses")
     job = relationship("JobRecord", back_populates="analyses")
 
     def to_summary(self) -> dict:
-        match_data = json.loads(self.match_report) if self.match_report else {}
+        match_data = self.match_report or {}
         return {
             "id": self.id,
             "resume_id": self.resume_id,
@@ -147,11 +233,10 @@ def init_db() -> None:
     Base.metadata.create_all(bind=engine)
 
 
-def get_db() -> Session:
-    """Get a database session. Use as a FastAPI dependency."""
+def get_db() -> Iterator[Session]:
+    """Yield a request-scoped database session. Use with FastAPI's Depends()."""
     db = SessionLocal()
     try:
-        return db
-    except Exception:
+        yield db
+    finally:
         db.close()
-        raise
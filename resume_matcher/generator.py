@@ -2,11 +2,14 @@
 
 from __future__ import annotations
 
+import re
 from io import BytesIO
+from xml.sax.saxutils import escape
 
 from docx import Document
-from docx.enum.text import WD_ALIGN_PARAGRAPH
+from docx.oxml.ns import qn
 from docx.shared import Inches, Pt, RGBColor
+from lxml import etree
 
 
 # Section rendering order
@@ -23,6 +26,72 @@ SECTION_ORDER = [
     "references",
 ]
 
+# Experience fallback: a line that looks like "Title — Company"
+_EXP_TITLE_RE = re.compile(r"^[A-Z][\w\s]+\s*[—\-–]\s*\w")
+
+# qn() does prefix resolution + string formatting on every call;
+# resolve the one qname the generator still needs at import time
+_QN_SECT_PR = qn("w:sectPr")
+
+# ── Paragraph XML templates ─────────────────────────────────────
+# The document body is assembled as one XML string and parsed once,
+# instead of going through python-docx's paragraph/run/font property
+# descriptors a few hundred times per resume. Sizes are half-points
+# (sz 20 = 10pt), spacing is twentieths of a point, indents are twips.
+
+_NAME_P = (
+    '<w:p><w:pPr><w:jc w:val="center"/></w:pPr>'
+    '<w:r><w:rPr><w:b/><w:color w:val="1A1A1A"/><w:sz w:val="36"/></w:rPr>'
+    '<w:t xml:space="preserve">{text}</w:t></w:r></w:p>'
+)
+_CONTACT_P = (
+    '<w:p><w:pPr><w:jc w:val="center"/></w:pPr>'
+    '<w:r><w:rPr><w:color w:val="555555"/><w:sz w:val="20"/></w:rPr>'
+    '<w:t xml:space="preserve">{text}</w:t></w:r></w:p>'
+)
+_RULE_P = (
+    "<w:p><w:pPr>"
+    '<w:pBdr><w:bottom w:val="single" w:sz="4" w:space="1" w:color="CCCCCC"/></w:pBdr>'
+    '<w:spacing w:before="0" w:after="40"/>'
+    "</w:pPr></w:p>"
+)
+_HEADING_P = (
+    '<w:p><w:pPr><w:spacing w:before="160" w:after="40"/></w:pPr>'
+    '<w:r><w:rPr><w:b/><w:color w:val="2C3E50"/><w:sz w:val="22"/></w:rPr>'
+    '<w:t xml:space="preserve">{text}</w:t></w:r></w:p>'
+)
+_BODY_P = (
+    '<w:p><w:pPr><w:spacing w:after="20"/></w:pPr>'
+    '<w:r><w:rPr><w:sz w:val="20"/></w:rPr>'
+    '<w:t xml:space="preserve">{text}</w:t></w:r></w:p>'
+)
+_BULLET_P = (
+    '<w:p><w:pPr><w:pStyle w:val="ListBullet"/>'
+    '<w:spacing w:after="20"/><w:ind w:left="360"/></w:pPr>'
+    '<w:r><w:rPr><w:sz w:val="20"/></w:rPr>'
+    '<w:t xml:space="preserve">{text}</w:t></w:r></w:p>'
+)
+_EXP_TITLE_P = (
+    '<w:p><w:pPr><w:spacing w:before="80" w:after="20"/></w:pPr>'
+    '<w:r><w:rPr><w:b/><w:sz w:val="20"/></w:rPr>'
+    '<w:t xml:space="preserve">{text}</w:t></w:r></w:p>'
+)
+_COMPANY_P = (
+    '<w:p><w:pPr><w:spacing w:before="120" w:after="0"/></w:pPr>'
+    '<w:r><w:rPr><w:b/><w:sz w:val="20"/></w:rPr>'
+    '<w:t xml:space="preserve">{text}</w:t></w:r></w:p>'
+)
+_TITLE_DATES_P = (
+    '<w:p><w:pPr><w:spacing w:before="0" w:after="20"/></w:pPr>'
+    '<w:r><w:rPr><w:i/><w:sz w:val="20"/></w:rPr>'
+    '<w:t xml:space="preserve">{text}</w:t></w:r></w:p>'
+)
+
+_BODY_WRAPPER = (
+    '<w:root xmlns:w="http://schemas.openxmlformats.org/wordprocessingml/2006/main">'
+    "{content}</w:root>"
+)
+
 
 class ResumeGenerator:
     """Generates a professional .docx resume from structured data."""
@@ -37,6 +106,14 @@ class ResumeGenerator:
         Returns:
             Bytes of the generated .docx file.
         """
+        return self.generate_buffer(resume_data).getvalue()
+
+    def generate_buffer(self, resume_data: dict) -> BytesIO:
+        """Generate a .docx document into a BytesIO, seeked back to 0.
+
+        Lets callers stream the result in chunks without holding a
+        second full copy of the bytes.
+        """
         sections = resume_data.get("sections", {})
         if not sections and "updated_sections" in resume_data:
             sections = resume_data["updated_sections"]
@@ -44,25 +121,29 @@ class ResumeGenerator:
         doc = Document()
         self._set_document_style(doc)
 
+        parts: list[str] = []
+
         # Render sections in standard order
         for category in SECTION_ORDER:
             if category in sections:
                 data = sections[category]
                 if category == "header":
-                    self._render_header(doc, data)
+                    self._render_header(parts, data)
                 else:
-                    self._render_section(doc, category, data)
+                    self._render_section(parts, category, data)
 
         # Render any remaining sections not in the standard order
         for category, data in sections.items():
             if category not in SECTION_ORDER:
-                self._render_section(doc, category, data)
+                self._render_section(parts, category, data)
+
+        self._attach_body(doc, parts)
 
         # Write to bytes
         buffer = BytesIO()
         doc.save(buffer)
         buffer.seek(0)
-        return buffer.read()
+        return buffer
 
     def _set_document_style(self, doc: Document) -> None:
         """Set default document margins and font."""
@@ -84,33 +165,37 @@ class ResumeGenerator:
         paragraph_format.space_before = Pt(0)
         paragraph_format.space_after = Pt(2)
 
-    def _render_header(self, doc: Document, data: dict) -> None:
+        # Materialize the bullet style so the pStyle references resolve
+        doc.styles["List Bullet"]
+
+    def _attach_body(self, doc: Document, parts: list[str]) -> None:
+        """Parse the assembled paragraphs once and splice them into the body."""
+        if not parts:
+            return
+        root = etree.fromstring(_BODY_WRAPPER.format(content="".join(parts)))
+        body = doc.element.body
+        sect_pr = body.find(_QN_SECT_PR)
+        for element in root:
+            sect_pr.addprevious(element)
+
+    def _render_header(self, parts: list[str], data: dict) -> None:
         """Render the contact/name header section."""
         content = data.get("content", [])
         if not content:
             return
 
         # First line is typically the name
-        name_para = doc.add_paragraph()
-        name_para.alignment = WD_ALIGN_PARAGRAPH.CENTER
-        name_run = name_para.add_run(content[0])
-        name_run.bold = True
-        name_run.font.size = Pt(18)
-        name_run.font.color.rgb = RGBColor(0x1A, 0x1A, 0x1A)
+        parts.append(_NAME_P.format(text=escape(content[0])))
 
         # Remaining lines are contact details
         for line in content[1:]:
-            contact_para = doc.add_paragraph()
-            contact_para.alignment = WD_ALIGN_PARAGRAPH.CENTER
-            contact_run = contact_para.add_run(line)
-            contact_run.font.size = Pt(10)
-            contact_run.font.color.rgb = RGBColor(0x55, 0x55, 0x55)
+            parts.append(_CONTACT_P.format(text=escape(line)))
 
         # Add a thin line after header
-        self._add_horizontal_rule(doc)
+        parts.append(_RULE_P)
 
     def _render_section(
-        self, doc: Document, category: str, data: dict
+        self, parts: list[str], category: str, data: dict
     ) -> None:
         """Render a standard resume section with heading and content."""
         heading = data.get("heading", category.title())
@@ -119,58 +204,38 @@ class ResumeGenerator:
         if not content:
             return
 
-        # Section heading
-        heading_para = doc.add_paragraph()
-        heading_para.paragraph_format.space_before = Pt(8)
-        heading_para.paragraph_format.space_after = Pt(2)
-        heading_run = heading_para.add_run(heading.upper())
-        heading_run.bold = True
-        heading_run.font.size = Pt(11)
-        heading_run.font.color.rgb = RGBColor(0x2C, 0x3E, 0x50)
-
-        # Add thin line under heading
-        self._add_horizontal_rule(doc)
+        # Section heading with a thin line underneath
+        parts.append(_HEADING_P.format(text=escape(heading.upper())))
+        parts.append(_RULE_P)
 
         # Content
         if category == "experience":
-            self._render_experience(doc, content, entries=data.get("entries"))
-        elif category == "skills":
-            self._render_skills(doc, content)
+            self._render_experience(parts, content, entries=data.get("entries"))
         else:
             for line in content:
-                para = doc.add_paragraph()
-                para.paragraph_format.space_after = Pt(1)
-                run = para.add_run(line)
-                run.font.size = Pt(10)
+                parts.append(_BODY_P.format(text=escape(line)))
 
-    def _render_experience(self, doc: Document, content: list[str], entries: list[dict] | None = None) -> None:
+    def _render_experience(
+        self,
+        parts: list[str],
+        content: list[str],
+        entries: list[dict] | None = None,
+    ) -> None:
         """Render experience section with structured entries or flat content fallback."""
         if entries:
-            self._render_experience_entries(doc, entries)
+            self._render_experience_entries(parts, entries)
             return
 
         # Fallback: flat content rendering (legacy data without entries)
-        import re
-
         for line in content:
-            is_title = bool(
-                re.match(r"^[A-Z][\w\s]+\s*[—\-–]\s*\w", line)
-            )
-            if is_title:
-                para = doc.add_paragraph()
-                para.paragraph_format.space_before = Pt(4)
-                para.paragraph_format.space_after = Pt(1)
-                run = para.add_run(line)
-                run.bold = True
-                run.font.size = Pt(10)
+            if _EXP_TITLE_RE.match(line):
+                parts.append(_EXP_TITLE_P.format(text=escape(line)))
             else:
-                para = doc.add_paragraph(style="List Bullet")
-                para.paragraph_format.space_after = Pt(1)
-                para.paragraph_format.left_indent = Inches(0.25)
-                run = para.add_run(line)
-                run.font.size = Pt(10)
+                parts.append(_BULLET_P.format(text=escape(line)))
 
-    def _render_experience_entries(self, doc: Document, entries: list[dict]) -> None:
+    def _render_experience_entries(
+        self, parts: list[str], entries: list[dict]
+    ) -> None:
         """Render structured experience entries with company, title, dates, and bullets."""
         for entry in entries:
             company = entry.get("company", "")
@@ -184,53 +249,15 @@ class ResumeGenerator:
                 company_line = company
                 if location:
                     company_line += f"  |  {location}"
-                para = doc.add_paragraph()
-                para.paragraph_format.space_before = Pt(6)
-                para.paragraph_format.space_after = Pt(0)
-                run = para.add_run(company_line)
-                run.bold = True
-                run.font.size = Pt(10)
+                parts.append(_COMPANY_P.format(text=escape(company_line)))
 
             # Title + Dates line
             if title or dates:
                 title_line = title if title else ""
                 if dates:
                     title_line += f"  |  {dates}" if title_line else dates
-                para = doc.add_paragraph()
-                para.paragraph_format.space_before = Pt(0)
-                para.paragraph_format.space_after = Pt(1)
-                run = para.add_run(title_line)
-                run.italic = True
-                run.font.size = Pt(10)
+                parts.append(_TITLE_DATES_P.format(text=escape(title_line)))
 
             # Bullets
             for bullet in bullets:
-                para = doc.add_paragraph(style="List Bullet")
-                para.paragraph_format.space_after = Pt(1)
-                para.paragraph_format.left_indent = Inches(0.25)
-                run = para.add_run(bullet)
-                run.font.size = Pt(10)
-
-    def _render_skills(self, doc: Document, content: list[str]) -> None:
-        """Render skills section."""
-        for line in content:
-            para = doc.add_paragraph()
-            para.paragraph_format.space_after = Pt(1)
-            run = para.add_run(line)
-            run.font.size = Pt(10)
-
-    def _add_horizontal_rule(self, doc: Document) -> None:
-        """Add a thin horizontal line."""
-        from docx.oxml.ns import qn
-        from lxml import etree
-
-        para = doc.add_paragraph()
-        para.paragraph_format.space_before = Pt(0)
-        para.paragraph_format.space_after = Pt(2)
-        pPr = para._element.get_or_add_pPr()
-        pBdr = etree.SubElement(pPr, qn("w:pBdr"))
-        bottom = etree.SubElement(pBdr, qn("w:bottom"))
-        bottom.set(qn("w:val"), "single")
-        bottom.set(qn("w:sz"), "4")
-        bottom.set(qn("w:space"), "1")
-        bottom.set(qn("w:color"), "CCCCCC")
+                parts.append(_BULLET_P.format(text=escape(bullet)))
@@ -2,11 +2,16 @@
 
 from __future__ import annotations
 
+import logging
 import re
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass, field
 
 import requests
-from bs4 import BeautifulSoup
+from bs4 import BeautifulSoup, SoupStrainer
+from requests.adapters import HTTPAdapter, Retry
+
+logger = logging.getLogger(__name__)
 
 # Patterns to identify JD sections
 JD_SECTION_PATTERNS: dict[str, list[str]] = {
@@ -47,12 +52,39 @@ JD_SECTION_PATTERNS: dict[str, list[str]] = {
     ],
 }
 
-COMPILED_JD_PATTERNS: dict[str, re.Pattern] = {}
-for _section, _patterns in JD_SECTION_PATTERNS.items():
-    _joined = "|".join(_patterns)
-    COMPILED_JD_PATTERNS[_section] = re.compile(
-        rf"^\s*(?:{_joined})\s*:?\s*$", re.IGNORECASE
+# One alternation with a named group per section: a heading line is
+# classified with a single C-level match (read via lastgroup) instead
+# of a Python loop over five compiled patterns.
+COMPILED_JD_MASTER = re.compile(
+    r"^\s*(?:"
+    + "|".join(
+        f"(?P<{_section}>{'|'.join(_patterns)})"
+        for _section, _patterns in JD_SECTION_PATTERNS.items()
     )
+    + r")\s*:?\s*$",
+    re.IGNORECASE,
+)
+
+
+# Bullet prefixes stripped from JD lines; a one-char set membership
+# check beats a regex roundtrip on the common no-bullet line
+_BULLET_CHARS = frozenset("\u2022\u2023\u25E6\u2043\u2219-*")
+
+# Job content always lives in the body; straining to it skips parsing
+# <head> scripts, styles, and metadata entirely
+_BODY_STRAINER = SoupStrainer("body")
+
+# Shared session: keep-alive and TLS reuse across fetches, plus a short
+# retry budget for the flaky career-page CDNs
+_SESSION = requests.Session()
+_SESSION.mount(
+    "https://",
+    HTTPAdapter(
+        pool_connections=10,
+        pool_maxsize=10,
+        max_retries=Retry(total=2, backoff_factor=0.5),
+    ),
+)
 
 
 @dataclass
@@ -91,12 +123,19 @@ class ParsedJobDescription:
 class JobDescriptionExtractor:
     """Extracts and structures job descriptions from text or URLs."""
 
-    def from_text(self, text: str) -> ParsedJobDescription:
-        """Parse a job description from raw text."""
-        lines = [line.strip() for line in text.strip().splitlines()]
+    def from_text(self, text: str, enhance: bool = False) -> ParsedJobDescription:
+        """Parse a job description from raw text.
+
+        With enhance=True the LLM extraction is launched up front and
+        overlapped with the regex parse, so wall clock is the LLM call
+        alone rather than parse + LLM.
+        """
+        lines = [s for s in (line.strip() for line in text.splitlines()) if s]
+        if enhance:
+            return self._parse_lines_enhanced(lines, text)
         return self._parse_lines(lines, text)
 
-    def from_url(self, url: str) -> ParsedJobDescription:
+    def from_url(self, url: str, enhance: bool = False) -> ParsedJobDescription:
         """Fetch a URL and extract the job description text."""
         headers = {
             "User-Agent": (
@@ -105,10 +144,12 @@ class JobDescriptionExtractor:
                 "Chrome/120.0.0.0 Safari/537.36"
             )
         }
-        resp = requests.get(url, headers=headers, timeout=15)
+        resp = _SESSION.get(url, headers=headers, timeout=15)
         resp.raise_for_status()
 
-        soup = BeautifulSoup(resp.text, "html.parser")
+        # lxml parses in C and gets raw bytes so encoding detection is
+        # done there too; career pages are routinely 500 KB+ of HTML
+        soup = BeautifulSoup(resp.content, "lxml", parse_only=_BODY_STRAINER)
 
         # Remove script/style elements
         for tag in soup(["script", "style", "nav", "footer", "header"]):
@@ -145,35 +186,52 @@ class JobDescriptionExtractor:
             title = title_tag.get_text(strip=True)
 
         lines = [line.strip() for line in text.splitlines() if line.strip()]
-        result = self._parse_lines(lines, text)
+        if enhance:
+            result = self._parse_lines_enhanced(lines, text)
+        else:
+            result = self._parse_lines(lines, text)
         if title:
             result.title = title
         return result
 
+    def _parse_lines_enhanced(
+        self, lines: list[str], raw_text: str
+    ) -> ParsedJobDescription:
+        """Run the LLM extraction concurrently with the regex parse."""
+        with ThreadPoolExecutor(max_workers=1) as pool:
+            future = pool.submit(self._request_llm_extraction, raw_text)
+            result = self._parse_lines(lines, raw_text)
+        try:
+            self._merge_llm_fields(result, future.result())
+        except Exception as exc:
+            logger.warning("LLM job extraction failed, using regex results: %s", exc)
+        return result
+
     def _parse_lines(
         self, lines: list[str], raw_text: str
     ) -> ParsedJobDescription:
         """Parse lines into structured sections."""
         result = ParsedJobDescription(raw_text=raw_text)
         current_section: str | None = None
+        # Bound once per heading so body lines append directly instead
+        # of re-resolving the section list through the dict every line
+        current_list: list[str] | None = None
 
+        # Callers pass pre-stripped, non-empty lines
         for line in lines:
-            if not line:
-                continue
-
             # Check if this line is a section heading
             matched_section = self._match_section(line)
             if matched_section:
                 current_section = matched_section
-                if current_section not in result.sections:
-                    result.sections[current_section] = []
+                current_list = result.sections.setdefault(current_section, [])
                 continue
 
-            if current_section:
+            if current_list is not None:
                 # Clean bullet characters
-                cleaned = re.sub(r"^[\u2022\u2023\u25E6\u2043\u2219•\-\*]\s*", "", line)
-                if cleaned:
-                    result.sections.setdefault(current_section, []).append(cleaned)
+                if line[0] in _BULLET_CHARS:
+                    line = line[1:].lstrip()
+                if line:
+                    current_list.append(line)
 
         # Build all_requirements from requirements + preferred
         for key in ["requirements", "preferred"]:
@@ -181,8 +239,8 @@ class JobDescriptionExtractor:
 
         # If no sections were detected, treat all content as requirements
         if not result.sections:
-            result.sections["general"] = [l for l in lines if l]
-            result.all_requirements = result.sections["general"]
+            result.sections["general"] = lines
+            result.all_requirements = lines
 
         # Try to guess title from first line if not set
         if not result.title and lines:
@@ -199,49 +257,71 @@ class JobDescriptionExtractor:
         preferred qualifications, location, and salary. Falls back gracefully
         if the LLM is unavailable.
         """
-        import json
-        import logging
-
-        from resume_matcher.llm_client import get_llm_client
-        from resume_matcher.prompts import JOB_EXTRACT_SYSTEM, JOB_EXTRACT_USER
-
-        logger = logging.getLogger(__name__)
-
         try:
-            client = get_llm_client()
-            prompt = JOB_EXTRACT_USER.format(job_text=result.raw_text[:8000])
-            data = client.complete_json(JOB_EXTRACT_SYSTEM, prompt)
-
-            # Merge LLM results into existing result (LLM wins for new fields,
-            # existing regex results are kept as fallback for sections)
-            if data.get("title") and not result.title:
-                result.title = data["title"]
-            if data.get("company_name"):
-                result.company = data["company_name"]
-            if data.get("company_background"):
-                result.company_background = data["company_background"]
-            if data.get("location"):
-                result.location = data["location"]
-            if data.get("salary_range"):
-                result.salary_range = data["salary_range"]
-            if data.get("required_qualifications"):
-                result.required_qualifications = data["required_qualifications"]
-            if data.get("preferred_qualifications"):
-                result.preferred_qualifications = data["preferred_qualifications"]
-            if data.get("responsibilities"):
-                result.responsibilities = data["responsibilities"]
-            if data.get("all_requirements") and not result.all_requirements:
-                result.all_requirements = data["all_requirements"]
-
+            data = self._request_llm_extraction(self._prompt_text(result))
         except Exception as exc:
             logger.warning("LLM job extraction failed, using regex results: %s", exc)
+            return result
 
+        self._merge_llm_fields(result, data)
         return result
 
+    def _prompt_text(self, result: ParsedJobDescription) -> str:
+        """Pick the JD text worth sending to the LLM.
+
+        Scraped pages are mostly nav, benefits, and boilerplate; when the
+        regex parse found the substantive sections, send just those
+        (title, responsibilities, requirements, preferred) instead of
+        blindly slicing the raw text mid-sentence at the size cap.
+        """
+        section_lines = (
+            result.sections.get("responsibilities", [])
+            + result.sections.get("requirements", [])
+            + result.sections.get("preferred", [])
+        )
+        if not section_lines:
+            return result.raw_text
+        return "\n".join([result.title] + section_lines).strip()
+
+    def _request_llm_extraction(self, raw_text: str) -> dict:
+        """Ask the LLM for structured JD fields; returns the raw response dict."""
+        from resume_matcher.llm_client import get_llm_client
+        from resume_matcher.prompts import JOB_EXTRACT_SYSTEM, JOB_EXTRACT_USER
+
+        client = get_llm_client()
+        prompt = JOB_EXTRACT_USER.format(job_text=raw_text[:8000])
+        return client.complete_json(JOB_EXTRACT_SYSTEM, prompt)
+
+    def _merge_llm_fields(
+        self, result: ParsedJobDescription, data: dict
+    ) -> None:
+        """Merge LLM results into the regex parse (LLM wins for new fields,
+        existing regex results are kept as fallback for sections)."""
+        if data.get("title") and not result.title:
+            result.title = data["title"]
+        if data.get("company_name"):
+            result.company = data["company_name"]
+        if data.get("company_background"):
+            result.company_background = data["company_background"]
+        if data.get("location"):
+            result.location = data["location"]
+        if data.get("salary_range"):
+            result.salary_range = data["salary_range"]
+        if data.get("required_qualifications"):
+            result.required_qualifications = data["required_qualifications"]
+        if data.get("preferred_qualifications"):
+            result.preferred_qualifications = data["preferred_qualifications"]
+        if data.get("responsibilities"):
+            result.responsibilities = data["responsibilities"]
+        if data.get("all_requirements") and not result.all_requirements:
+            result.all_requirements = data["all_requirements"]
+
     def _match_section(self, text: str) -> str | None:
         """Check if text matches a known JD section heading."""
         stripped = text.strip().rstrip(":")
-        for section, pattern in COMPILED_JD_PATTERNS.items():
-            if pattern.match(stripped):
-                return section
-        return None
+        # Cheap gate: headings are short and start with a letter, so
+        # typical content lines never reach the regex engine at all
+        if not stripped or len(stripped) > 40 or not stripped[0].isalpha():
+            return None
+        match = COMPILED_JD_MASTER.match(stripped)
+        return match.lastgroup if match else None
@@ -2,18 +2,82 @@
 
 from __future__ import annotations
 
+import hashlib
 import json
 import logging
+import os
+import random
 import time
+from concurrent.futures import ThreadPoolExecutor
 from typing import Any
 
+import orjson
+
 from resume_matcher.config import get_settings
 
+# Optional provider SDKs, resolved once at module load. Each is None
+# when not installed; the matching provider raises on first use. This
+# keeps per-call import-machinery overhead out of the hot path and
+# works under multiprocessing, where function-local imports re-run in
+# every worker.
+try:
+    from google import genai as _genai
+except ImportError:  # pragma: no cover - optional dependency
+    _genai = None
+
+try:
+    import anthropic as _anthropic
+except ImportError:  # pragma: no cover - optional dependency
+    _anthropic = None
+
+try:
+    from openai import OpenAI as _OpenAI
+except ImportError:  # pragma: no cover - optional dependency
+    _OpenAI = None
+
 logger = logging.getLogger(__name__)
 
 # Maximum retries for transient failures
 _MAX_RETRIES = 3
-_RETRY_BACKOFF = [1, 3, 5]  # seconds
+_RETRY_BACKOFF = [1, 3, 5]  # seconds, plus up to 50% jitter
+
+# Rendered schema prompt suffixes, keyed by schema identity. Callers
+# pass module-level schema dicts, so each one is serialized exactly
+# once; keeping the dict in the value pins its id.
+_SCHEMA_SUFFIX_CACHE: dict[int, tuple[dict, str]] = {}
+
+
+def _schema_suffix(schema: dict) -> str:
+    cached = _SCHEMA_SUFFIX_CACHE.get(id(schema))
+    if cached is not None and cached[0] is schema:
+        return cached[1]
+    suffix = (
+        "\n\nReturn your response as JSON matching this schema:"
+        f"\n```json\n{json.dumps(schema, indent=2)}\n```"
+    )
+    _SCHEMA_SUFFIX_CACHE[id(schema)] = (schema, suffix)
+    return suffix
+
+
+def _is_retryable(exc: Exception) -> bool:
+    """Whether an LLM call failure is worth retrying.
+
+    Only transient conditions (429/408, 5xx, and errors with no HTTP
+    status such as timeouts or connection resets) retry; other 4xx
+    responses mean the request itself is bad and will never succeed.
+    The status is read generically so all three provider SDKs' error
+    types are covered without importing them.
+    """
+    status = getattr(exc, "status_code", None)
+    if status is None:
+        status = getattr(getattr(exc, "response", None), "status_code", None)
+    if status is None:
+        code = getattr(exc, "code", None)
+        if isinstance(code, int):
+            status = code
+    if status is None:
+        return True
+    return status in (408, 429) or status >= 500
 
 
 class LLMClient:
@@ -40,6 +104,15 @@ class LLMClient:
                 f"Set {self.provider.upper()}_API_KEY in your .env file."
             )
 
+        # Provider SDK client, created on first call and reused so the
+        # underlying HTTP pool and TLS session survive across requests
+        self._sdk_client: Any = None
+
+        self.cache_dir: str | None = None
+        if settings.llm_cache_enabled:
+            self.cache_dir = os.path.join(settings.data_dir, "llm_cache")
+            os.makedirs(self.cache_dir, exist_ok=True)
+
     # ── Public API ─────────────────────────────────────────────────
 
     def complete(self, system_prompt: str, user_prompt: str) -> str:
@@ -64,19 +137,86 @@ class LLMClient:
 
         Raises:
             ValueError: If the response cannot be parsed as JSON after retries.
+
+        Note:
+            Responses are deliberately not streamed. Every caller needs
+            the complete parsed dict before doing any work, so streaming
+            would only add three per-SDK accumulation paths without
+            shortening wall-clock time; concurrency across calls comes
+            from complete_json_batch instead.
         """
         if schema:
-            user_prompt += f"\n\nReturn your response as JSON matching this schema:\n```json\n{json.dumps(schema, indent=2)}\n```"
+            user_prompt += _schema_suffix(schema)
 
         raw = self._call_with_retry(system_prompt, user_prompt, json_mode=True)
         return self._parse_json(raw)
 
+    def complete_batch(
+        self, pairs: list[tuple[str, str]], max_workers: int = 8
+    ) -> list[str]:
+        """Run several (system_prompt, user_prompt) calls concurrently.
+
+        LLM calls are I/O-bound, so fanning out over threads makes a
+        batch cost roughly one call's latency instead of the sum.
+        Results are returned in input order.
+        """
+        if not pairs:
+            return []
+        with ThreadPoolExecutor(max_workers=min(max_workers, len(pairs))) as pool:
+            futures = [
+                pool.submit(self._call_with_retry, system, user, False)
+                for system, user in pairs
+            ]
+            return [future.result() for future in futures]
+
+    def complete_json_batch(
+        self, pairs: list[tuple[str, str]], max_workers: int = 8
+    ) -> list[dict]:
+        """JSON variant of complete_batch. Results are in input order."""
+        if not pairs:
+            return []
+        with ThreadPoolExecutor(max_workers=min(max_workers, len(pairs))) as pool:
+            futures = [
+                pool.submit(self._call_with_retry, system, user, True)
+                for system, user in pairs
+            ]
+            return [self._parse_json(future.result()) for future in futures]
+
     # ── Provider dispatch ──────────────────────────────────────────
 
+    def _cache_path(
+        self, system_prompt: str, user_prompt: str, json_mode: bool
+    ) -> str:
+        """Cache file path keyed by provider, model, and full prompt."""
+        key = hashlib.sha256(
+            "\x00".join(
+                (
+                    self.provider,
+                    self.model,
+                    str(self.temperature),
+                    system_prompt,
+                    user_prompt,
+                    str(json_mode),
+                )
+            ).encode()
+        ).hexdigest()
+        return os.path.join(self.cache_dir, f"{key}.txt")
+
     def _call_with_retry(
         self, system_prompt: str, user_prompt: str, json_mode: bool
     ) -> str:
         """Call the LLM with retry logic for transient failures."""
+        # Identical prompts return the cached response when enabled —
+        # re-runs on unchanged inputs cost ~1ms instead of a full call
+        cache_path = None
+        if self.cache_dir:
+            cache_path = self._cache_path(system_prompt, user_prompt, json_mode)
+            try:
+                with open(cache_path, encoding="utf-8") as f:
+                    return f.read()
+            except OSError:
+                pass
+
         last_error: Exception | None = None
 
         for attempt in range(_MAX_RETRIES):
@@ -91,13 +231,20 @@ class LLMClient:
                     elapsed,
                     len(result),
                 )
+                if cache_path:
+                    with open(cache_path, "w", encoding="utf-8") as f:
+                        f.write(result)
                 return result
             except Exception as exc:
+                if not _is_retryable(exc):
+                    raise
                 last_error = exc
                 if attempt < _MAX_RETRIES - 1:
+                    # Jitter desynchronizes retries when calls are batched
                     wait = _RETRY_BACKOFF[attempt]
+                    wait += random.uniform(0, wait * 0.5)
                     logger.warning(
-                        "LLM call failed (attempt %d/%d): %s. Retrying in %ds...",
+                        "LLM call failed (attempt %d/%d): %s. Retrying in %.1fs...",
                         attempt + 1,
                         _MAX_RETRIES,
                         exc,
@@ -127,9 +274,13 @@ class LLMClient:
     def _call_gemini(
         self, system_prompt: str, user_prompt: str, json_mode: bool
     ) -> str:
-        from google import genai
-
-        client = genai.Client(api_key=self.api_key)
+        if self._sdk_client is None:
+            if _genai is None:
+                raise ImportError(
+                    "google-genai is not installed; run `pip install google-genai`."
+                )
+            self._sdk_client = _genai.Client(api_key=self.api_key)
+        client = self._sdk_client
 
         config: dict[str, Any] = {
             "temperature": self.temperature,
@@ -152,9 +303,13 @@ class LLMClient:
     def _call_anthropic(
         self, system_prompt: str, user_prompt: str, json_mode: bool
     ) -> str:
-        import anthropic
-
-        client = anthropic.Anthropic(api_key=self.api_key)
+        if self._sdk_client is None:
+            if _anthropic is None:
+                raise ImportError(
+                    "anthropic is not installed; run `pip install anthropic`."
+                )
+            self._sdk_client = _anthropic.Anthropic(api_key=self.api_key)
+        client = self._sdk_client
 
         prompt = user_prompt
         if json_mode:
@@ -174,9 +329,13 @@ class LLMClient:
     def _call_openai(
         self, system_prompt: str, user_prompt: str, json_mode: bool
     ) -> str:
-        from openai import OpenAI
-
-        client = OpenAI(api_key=self.api_key)
+        if self._sdk_client is None:
+            if _OpenAI is None:
+                raise ImportError(
+                    "openai is not installed; run `pip install openai`."
+                )
+            self._sdk_client = _OpenAI(api_key=self.api_key)
+        client = self._sdk_client
 
         kwargs: dict[str, Any] = {
             "model": self.model,
@@ -208,8 +367,8 @@ class LLMClient:
             text = "\n".join(lines).strip()
 
         try:
-            return json.loads(text)
-        except json.JSONDecodeError as exc:
+            return orjson.loads(text)
+        except orjson.JSONDecodeError as exc:
             raise ValueError(
                 f"LLM response is not valid JSON: {exc}\nRaw response:\n{text[:500]}"
             ) from exc
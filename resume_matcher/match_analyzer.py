@@ -4,6 +4,7 @@ from __future__ import annotations
 
 import re
 from dataclasses import dataclass, field
+from functools import lru_cache
 
 
 @dataclass
@@ -48,7 +49,7 @@ class MatchReport:
 
 
 # Common filler words to ignore during keyword extraction
-STOP_WORDS = {
+STOP_WORDS = frozenset({
     "a", "an", "the", "and", "or", "but", "in", "on", "at", "to", "for",
     "of", "with", "by", "from", "is", "are", "was", "were", "be", "been",
     "being", "have", "has", "had", "do", "does", "did", "will", "would",
@@ -64,10 +65,10 @@ STOP_WORDS = {
     "strong", "excellent", "good", "great", "best", "high", "highly",
     "minimum", "preferred", "required", "requirements", "looking",
     "join", "team", "role", "position", "company", "years", "year",
-}
+})
 
 # Multi-word technical terms to detect as single units
-COMPOUND_TERMS = [
+COMPOUND_TERMS = (
     "machine learning", "deep learning", "natural language processing",
     "computer vision", "data science", "data engineering", "data analysis",
     "project management", "product management", "software engineering",
@@ -78,46 +79,92 @@ COMPOUND_TERMS = [
     "object oriented", "test driven", "continuous integration",
     "continuous delivery", "continuous deployment",
     "amazon web services", "google cloud", "microsoft azure",
-]
-
-
-def _normalize(text: str) -> str:
-    """Lowercase and clean text for comparison."""
-    return re.sub(r"[^\w\s/\+\#\.]", " ", text.lower()).strip()
-
-
-def _extract_keywords(text: str) -> set[str]:
-    """Extract meaningful keywords and phrases from text."""
-    normalized = _normalize(text)
+)
+
+
+# A token is letters/digits/+/#/_ optionally joined by . or / (node.js,
+# ci/cd, c++), at least two chars, with no leading or trailing
+# punctuation — so tokenization is a single C-level regex scan instead
+# of normalize + split + per-word strip
+_TOKEN_RE = re.compile(r"[a-z0-9_+#][a-z0-9_+#./]*[a-z0-9_+#]")
+
+# All compound terms folded into one alternation inside a lookahead:
+# the text is scanned once (instead of one substring search per term)
+# and overlapping terms such as "amazon web services" / "web services"
+# are still both reported. Separators are flexible so hyphenated
+# spellings ("machine-learning") match too.
+_COMPOUND_RE = re.compile(
+    "(?=("
+    + "|".join(
+        r"[\s\-]+".join(map(re.escape, _term.split()))
+        for _term in COMPOUND_TERMS
+    )
+    + "))"
+)
+_COMPOUND_SEP_RE = re.compile(r"[\s\-]+")
+
+# Word pattern for _extract_tech_keywords; compiled once so per-call
+# cost is the scan itself, not a compile-cache lookup
+_TECH_WORD_RE = re.compile(r"[\w\+\#\.]+")
+
+# For placement suggestions: the compound terms themselves plus every
+# word occurring in one, so "is this keyword compound-related" is an
+# O(1) membership check instead of a substring scan over all terms
+_COMPOUND_SET = frozenset(COMPOUND_TERMS)
+_COMPOUND_UNIGRAMS = frozenset(
+    word for term in COMPOUND_TERMS for word in term.split()
+)
+
+
+def _find_compound_terms(text_lower: str) -> set[str]:
+    """Single-pass scan for multi-word technical terms."""
+    return {
+        _COMPOUND_SEP_RE.sub(" ", match)
+        for match in _COMPOUND_RE.findall(text_lower)
+    }
+
+
+def _extract_keywords(*texts: str) -> set[str]:
+    """Extract meaningful keywords and phrases from one or more texts.
+
+    Accepts the text in chunks so callers holding line lists feed them
+    straight into the tokenizer instead of materializing one big joined
+    string first. Each chunk gets one findall pass plus the compound
+    scan; the stop-word difference runs once at the end in C.
+    """
     keywords: set[str] = set()
-
-    # Extract compound terms first
-    for term in COMPOUND_TERMS:
-        if term in normalized:
-            keywords.add(term)
-
-    # Extract individual words
-    words = normalized.split()
-    for word in words:
-        word = word.strip(".,;:()")
-        if len(word) < 2:
-            continue
-        if word in STOP_WORDS:
-            continue
-        # Keep words that look like skills/technologies
-        keywords.add(word)
-
-    return keywords
+    for text in texts:
+        text_lower = text.lower()
+        keywords.update(_TOKEN_RE.findall(text_lower))
+        keywords |= _find_compound_terms(text_lower)
+    return keywords - STOP_WORDS
+
+
+@lru_cache(maxsize=128)
+def _keywords_for_text(*texts: str) -> frozenset[str]:
+    """Importance-filtered keyword set for one or more texts, memoized.
+
+    Bulk matching repeats texts (one resume against many jobs, or one
+    job against many resumes); the cache turns every repeat into a
+    dict hit instead of a full tokenize-and-filter pass. The frozenset
+    return keeps downstream &/- operations at C speed and is safe to
+    share between callers.
+    """
+    # Skip very short non-acronym words and pure numbers
+    return frozenset(
+        kw
+        for kw in _extract_keywords(*texts)
+        if (len(kw) > 2 or kw.isupper()) and not kw.isdigit()
+    )
 
 
 def _extract_tech_keywords(text: str) -> set[str]:
     """Extract technology-specific keywords (more targeted)."""
-    normalized = _normalize(text)
     tech_keywords: set[str] = set()
 
     # Common tech patterns: capitalized words, words with dots/hashes/plusses
     # Look for things like Python, AWS, C++, .NET, Node.js, etc.
-    raw_words = re.findall(r"[\w\+\#\.]+", text)
+    raw_words = _TECH_WORD_RE.findall(text)
     for word in raw_words:
         lower = word.lower().strip(".,;:()")
         if lower in STOP_WORDS or len(lower) < 2:
@@ -125,9 +172,7 @@ def _extract_tech_keywords(text: str) -> set[str]:
         tech_keywords.add(lower)
 
     # Also get compound terms
-    for term in COMPOUND_TERMS:
-        if term in normalized:
-            tech_keywords.add(term)
+    tech_keywords |= _find_compound_terms(text.lower())
 
     return tech_keywords
 
@@ -135,55 +180,92 @@ def _extract_tech_keywords(text: str) -> set[str]:
 class MatchAnalyzer:
     """Compares a parsed resume against a parsed job description."""
 
+    def extract_resume_keywords(self, resume_data: dict) -> frozenset[str]:
+        """Extract the keyword set used to match a resume against jobs.
+
+        Exposed so callers can compute this once when the resume is
+        parsed, persist it, and hand it back to analyze() on later
+        requests instead of re-tokenizing the full resume text. The
+        returned set is already importance-filtered, keeping the
+        persisted artifact as small as possible.
+        """
+        # Feed section content lines directly; no joined-text intermediate,
+        # and the line tuple doubles as the memoization key
+        return _keywords_for_text(
+            *(
+                line
+                for data in resume_data.get("sections", {}).values()
+                for line in data.get("content", [])
+            )
+        )
+
     def analyze(
-        self, resume_data: dict, job_data: dict
+        self,
+        resume_data: dict,
+        job_data: dict,
+        resume_keywords: frozenset[str] | set[str] | None = None,
     ) -> MatchReport:
         """Analyze how well a resume matches a job description.
 
         Args:
             resume_data: Output from ResumeParser.to_dict()
             job_data: Output from JobDescriptionExtractor.to_dict()
+            resume_keywords: Precomputed extract_resume_keywords() result
+                for resume_data; extracted fresh when omitted.
 
         Returns:
             MatchReport with score, matching/missing keywords, recommendations.
         """
         report = MatchReport()
 
-        # Build text from resume
         resume_sections = resume_data.get("sections", {})
-        resume_text = self._sections_to_text(resume_sections)
-        resume_keywords = _extract_keywords(resume_text)
+        if resume_keywords is None:
+            resume_keywords = self.extract_resume_keywords(resume_data)
 
-        # Build text from job description
-        jd_requirements = job_data.get("all_requirements", [])
+        # Build the JD keyword set from requirements (falling back to
+        # all section content) plus responsibilities, line by line —
+        # no joined-text intermediates
         jd_sections = job_data.get("sections", {})
-        jd_text = " ".join(jd_requirements)
-        if not jd_text:
-            # Fall back to all section content
-            for lines in jd_sections.values():
-                jd_text += " ".join(lines) + " "
-        jd_keywords = _extract_keywords(jd_text)
-
-        # Also extract from responsibilities
-        responsibilities_text = " ".join(jd_sections.get("responsibilities", []))
-        jd_keywords.update(_extract_keywords(responsibilities_text))
-
-        # Filter to meaningful keywords (skip very common words)
-        jd_important = self._filter_important(jd_keywords)
-        resume_important = self._filter_important(resume_keywords)
+        jd_lines = job_data.get("all_requirements", [])
+        if not jd_lines:
+            jd_lines = [
+                line for lines in jd_sections.values() for line in lines
+            ]
+
+        # Filter to meaningful keywords (skip very common words);
+        # resume keywords come pre-filtered from extract_resume_keywords()
+        jd_important = _keywords_for_text(
+            *jd_lines, *jd_sections.get("responsibilities", [])
+        )
+        resume_important = resume_keywords
+
+        # Nothing to match against: skip the set algebra and placement
+        # work and return the zero-score report directly
+        if not jd_important:
+            report.recommendations = self._generate_recommendations(report)
+            return report
+
+        # Common low-match fast path: isdisjoint bails at the first
+        # shared element and allocates nothing, so a zero-overlap pair
+        # skips the intersection/difference set builds entirely
+        if jd_important.isdisjoint(resume_important):
+            report.missing_keywords = sorted(jd_important)
+            report.keyword_placement = self._suggest_placement(
+                jd_important, resume_sections
+            )
+            report.recommendations = self._generate_recommendations(report)
+            return report
 
-        # Find matches and gaps
-        matching = jd_important & resume_important
-        missing = jd_important - resume_important
+        # Find matches and gaps; the method forms iterate the smaller
+        # operand in C without operator dispatch
+        matching = jd_important.intersection(resume_important)
+        missing = jd_important.difference(resume_important)
 
         report.matching_keywords = sorted(matching)
         report.missing_keywords = sorted(missing)
 
         # Calculate keyword-based score
-        if jd_important:
-            report.keyword_score = (len(matching) / len(jd_important)) * 100
-        else:
-            report.keyword_score = 0.0
+        report.keyword_score = (len(matching) / len(jd_important)) * 100
         report.overall_score = report.keyword_score
 
         # Suggest where to place missing keywords
@@ -196,6 +278,21 @@ class MatchAnalyzer:
 
         return report
 
+    def analyze_batch(
+        self, resume_data: dict, jobs: list[dict]
+    ) -> list[MatchReport]:
+        """Analyze one resume against many job descriptions.
+
+        The resume keyword set is extracted and filtered once, then
+        shared across every comparison, so each additional JD costs
+        only its own tokenization plus the C-level set algebra.
+        """
+        resume_keywords = self.extract_resume_keywords(resume_data)
+        return [
+            self.analyze(resume_data, job, resume_keywords=resume_keywords)
+            for job in jobs
+        ]
+
     def analyze_with_llm(
         self, resume_data: dict, job_data: dict
     ) -> MatchReport:
@@ -204,11 +301,17 @@ class MatchAnalyzer:
         Combines keyword-based score (30%) with LLM semantic score (70%)
         for a more accurate overall assessment.
         """
-        import json
         import logging
 
+        import orjson
+
         from resume_matcher.llm_client import get_llm_client
-        from resume_matcher.prompts import MATCH_SCORE_SYSTEM, MATCH_SCORE_USER
+        from resume_matcher.prompts import (
+            MATCH_SCORE_SYSTEM,
+            MATCH_SCORE_USER,
+            compact_job_for_prompt,
+            compact_resume_for_prompt,
+        )
 
         logger = logging.getLogger(__name__)
 
@@ -219,8 +322,10 @@ class MatchAnalyzer:
         try:
             client = get_llm_client()
             prompt = MATCH_SCORE_USER.format(
-                resume_json=json.dumps(resume_data, indent=2)[:6000],
-                job_json=json.dumps(job_data, indent=2)[:4000],
+                resume_json=orjson.dumps(
+                    compact_resume_for_prompt(resume_data)
+                ).decode(),
+                job_json=orjson.dumps(compact_job_for_prompt(job_data)).decode(),
             )
             llm_result = client.complete_json(MATCH_SCORE_SYSTEM, prompt)
 
@@ -272,27 +377,6 @@ class MatchAnalyzer:
             }
         return {"feasible": True}
 
-    def _sections_to_text(self, sections: dict) -> str:
-        """Flatten all resume sections into a single text string."""
-        parts = []
-        for data in sections.values():
-            content = data.get("content", [])
-            parts.extend(content)
-        return " ".join(parts)
-
-    def _filter_important(self, keywords: set[str]) -> set[str]:
-        """Keep only keywords that are likely meaningful for matching."""
-        important = set()
-        for kw in keywords:
-            # Skip very short non-acronym words
-            if len(kw) <= 2 and not kw.isupper():
-                continue
-            # Skip pure numbers
-            if kw.isdigit():
-                continue
-            important.add(kw)
-        return important
-
     def _suggest_placement(
         self, missing: set[str], resume_sections: dict
     ) -> dict[str, str]:
@@ -300,7 +384,7 @@ class MatchAnalyzer:
         placement: dict[str, str] = {}
         # Simple heuristic: technical terms go to skills, others to experience
         for keyword in missing:
-            if any(keyword in term for term in COMPOUND_TERMS):
+            if keyword in _COMPOUND_SET or keyword in _COMPOUND_UNIGRAMS:
                 placement[keyword] = "skills"
             elif len(keyword) <= 5 and keyword.replace("+", "").replace("#", "").isalpha():
                 # Short words that look like tech abbreviations
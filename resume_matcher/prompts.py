@@ -199,3 +199,61 @@ For each question, return a JSON array:
 Use "high" confidence when the resume directly supports the answer.
 Use "medium" when you're inferring from available information.
 Use "low" when the resume lacks relevant data and you're providing a generic response."""
+
+
+# ── Prompt payload pruning ─────────────────────────────────────
+
+
+def compact_resume_for_prompt(
+    resume_data: dict, max_entries: int = 5, max_bullets: int = 6
+) -> dict:
+    """Prune a parsed resume down to what an LLM prompt actually needs.
+
+    Drops raw_text and caps experience entries/bullets, so callers can
+    serialize the result whole instead of byte-slicing a full JSON dump
+    (which hands the model truncated, malformed JSON).
+    """
+    compact_sections: dict = {}
+    for category, data in resume_data.get("sections", {}).items():
+        entries = data.get("entries") if category == "experience" else None
+        if entries:
+            compact_sections[category] = {
+                "heading": data.get("heading", ""),
+                "entries": [
+                    {
+                        "company": entry.get("company", ""),
+                        "title": entry.get("title", ""),
+                        "dates": entry.get("dates", ""),
+                        "bullets": entry.get("bullets", [])[:max_bullets],
+                    }
+                    for entry in entries[:max_entries]
+                ],
+            }
+        else:
+            compact_sections[category] = {
+                "heading": data.get("heading", ""),
+                "content": data.get("content", []),
+            }
+    return {"sections": compact_sections}
+
+
+def compact_job_for_prompt(job_data: dict, max_requirements: int = 30) -> dict:
+    """Prune a parsed job description for prompt use.
+
+    Keeps the identifying fields and the requirement lists; drops
+    raw_text, which duplicates everything the sections already carry.
+    """
+    compact = {
+        key: job_data[key]
+        for key in ("title", "company", "location")
+        if job_data.get(key)
+    }
+    requirements = job_data.get("all_requirements") or []
+    if requirements:
+        compact["requirements"] = requirements[:max_requirements]
+    responsibilities = job_data.get("responsibilities") or []
+    if responsibilities:
+        compact["responsibilities"] = responsibilities[:max_requirements]
+    if not requirements and not responsibilities:
+        compact["sections"] = job_data.get("sections", {})
+    return compact
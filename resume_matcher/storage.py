@@ -10,6 +10,10 @@ Interface:
 from __future__ import annotations
 
 import os
+import shutil
+from typing import BinaryIO
+
+import aiofiles
 
 DATA_DIR = os.path.join(os.path.dirname(os.path.dirname(__file__)), "data")
 
@@ -24,19 +28,35 @@ class FileStorage:
 
     def __init__(self, base_dir: str = DATA_DIR):
         self.base_dir = base_dir
+        # Categories already created this process; skips the makedirs
+        # stat chain on every save after the first per category
+        self._ensured: set[str] = set()
 
     def _ensure_dir(self, category: str) -> str:
         path = os.path.join(self.base_dir, category)
-        os.makedirs(path, exist_ok=True)
+        if category not in self._ensured:
+            os.makedirs(path, exist_ok=True)
+            self._ensured.add(category)
         return path
 
-    def save(self, category: str, file_id: str, data: bytes, ext: str = ".docx") -> str:
+    def save(
+        self,
+        category: str,
+        file_id: str,
+        data: bytes | BinaryIO,
+        ext: str = ".docx",
+    ) -> str:
         """Save a file and return its relative path.
 
+        Writes to a temp file in the same directory and renames it into
+        place, so a crash mid-write never leaves a half-written file at
+        the final path. Streams are copied in 1 MB chunks, letting
+        callers pass file-like data without materializing bytes.
+
         Args:
             category: "uploads" or "outputs"
             file_id: unique identifier (e.g. resume_id)
-            data: raw file bytes
+            data: raw file bytes or a binary stream
             ext: file extension
 
         Returns:
@@ -45,8 +65,36 @@ class FileStorage:
         dir_path = self._ensure_dir(category)
         filename = f"{file_id}{ext}"
         full_path = os.path.join(dir_path, filename)
-        with open(full_path, "wb") as f:
-            f.write(data)
+        tmp_path = full_path + ".tmp"
+        if isinstance(data, bytes):
+            # Unbuffered descriptor write: one syscall, no BufferedWriter
+            # copy of a blob we already hold in full
+            fd = os.open(tmp_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644)
+            try:
+                os.write(fd, data)
+            finally:
+                os.close(fd)
+        else:
+            with open(tmp_path, "wb") as f:
+                shutil.copyfileobj(data, f, length=1 << 20)
+        os.replace(tmp_path, full_path)
+        return os.path.join(category, filename)
+
+    async def save_async(
+        self, category: str, file_id: str, data: bytes, ext: str = ".docx"
+    ) -> str:
+        """Async variant of save() for use inside request handlers.
+
+        Writes through aiofiles so the disk write overlaps other
+        event-loop work instead of stalling it.
+        """
+        dir_path = self._ensure_dir(category)
+        filename = f"{file_id}{ext}"
+        full_path = os.path.join(dir_path, filename)
+        tmp_path = full_path + ".tmp"
+        async with aiofiles.open(tmp_path, "wb") as f:
+            await f.write(data)
+        os.replace(tmp_path, full_path)
         return os.path.join(category, filename)
 
     def load(self, category: str, file_id: str, ext: str = ".docx") -> bytes:
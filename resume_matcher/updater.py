@@ -8,15 +8,80 @@ from __future__ import annotations
 import json
 import logging
 import re
-from copy import deepcopy
 from dataclasses import dataclass, field
+from functools import lru_cache
 
 from resume_matcher.ats_optimizer import ATS_STANDARD_SECTIONS, HEADING_RENAMES
 
 logger = logging.getLogger(__name__)
 
-
-@dataclass
+# Case-normalized view of the static rename table, built once at
+# import: headings that differ from a known rename only by case still
+# resolve with one dict probe even when the per-call suggestions miss
+_STATIC_RENAME_LOOKUP = {k.casefold(): v for k, v in HEADING_RENAMES.items()}
+
+# Bullet enhancement phrasings, chosen deterministically per keyword so
+# enhanced bullets don't all end with the identical clause. Keyword
+# length keys the pick: hash() is randomized per process and would make
+# output differ between runs.
+_ENHANCE_TEMPLATES = (
+    "{c}, utilizing {k}.",
+    "{c}, leveraging {k}.",
+    "{c} using {k}.",
+)
+
+# A line that looks like "Title — Company" rather than a bullet;
+# compiled once instead of through re.match's cache on every line
+_JOB_TITLE_RE = re.compile(r"^[A-Z][\w\s]+\s*[—\-–]\s*\w")
+
+# Tokens in a skills line, keeping tech punctuation (c++, node.js, c#)
+_SKILL_TOKEN_RE = re.compile(r"[a-z0-9_+#][a-z0-9_+#./]*[a-z0-9_+#]|[a-z0-9]")
+
+# Four-letter terms that should stay uppercase rather than title-cased
+# (three letters and under are already uppercased by length)
+_KNOWN_ACRONYMS = frozenset({"html", "json", "yaml", "http", "grpc", "ajax", "ldap", "saml"})
+
+
+@lru_cache(maxsize=4096)
+def _format_skill(skill: str) -> str:
+    """Format a skill keyword for display (capitalize properly).
+
+    Cached: the same keyword is formatted from the skills, experience,
+    and summary passes of a single update, and repeats across requests.
+    """
+    # Keep known acronyms uppercase
+    if len(skill) <= 4 and skill.isalpha():
+        if len(skill) <= 3 or skill.lower() in _KNOWN_ACRONYMS:
+            return skill.upper()
+        return skill.title()
+    # Keep terms with special chars as-is (e.g. c++, node.js)
+    if not skill.isalpha():
+        return skill
+    return skill.title()
+
+
+def _clone_sections(sections: dict) -> dict:
+    """Copy parsed sections just deep enough that updates can't leak back.
+
+    The section shape is fixed (strings, lists of strings, and optional
+    entry dicts), so rebuilding it directly is much cheaper than deepcopy's
+    generic per-object recursion and memo bookkeeping.
+    """
+    cloned: dict = {}
+    for category, data in sections.items():
+        copied = dict(data)
+        if "content" in copied:
+            copied["content"] = list(copied["content"])
+        if "entries" in copied:
+            copied["entries"] = [
+                {**entry, "bullets": list(entry.get("bullets", []))}
+                for entry in copied["entries"]
+            ]
+        cloned[category] = copied
+    return cloned
+
+
+@dataclass(slots=True)
 class UpdateResult:
     """Result of updating a resume to match a job description."""
 
@@ -52,17 +117,29 @@ class ResumeUpdater:
             UpdateResult with modified sections and change log.
         """
         result = UpdateResult()
-        sections = deepcopy(resume_data.get("sections", {}))
+        sections = _clone_sections(resume_data.get("sections", {}))
 
         # Step 1: Fix ATS heading issues
         if ats_report:
             self._fix_headings(sections, ats_report, result)
 
+        # Bucket missing keywords by target section in one pass instead
+        # of each consumer re-walking the list against the placement map
+        placement = match_report.get("keyword_placement", {})
+        skills_to_add: list[str] = []
+        exp_keywords: list[str] = []
+        for kw in match_report.get("missing_keywords", []):
+            target = placement.get(kw)
+            if target == "skills":
+                skills_to_add.append(kw)
+            elif target == "experience":
+                exp_keywords.append(kw)
+
         # Step 2: Add missing keywords to skills section
-        self._update_skills(sections, match_report, result)
+        self._update_skills(sections, skills_to_add, result)
 
         # Step 3: Enhance experience bullets with missing keywords
-        self._update_experience(sections, match_report, result)
+        self._update_experience(sections, exp_keywords, result)
 
         # Step 4: Update summary with key terms
         self._update_summary(sections, match_report, result)
@@ -120,24 +197,25 @@ class ResumeUpdater:
     ) -> None:
         """Rename section headings to ATS-standard names."""
         suggestions = ats_report.get("heading_suggestions", {})
-        for category, data in sections.items():
+        if not suggestions:
+            return
+        for data in sections.values():
             heading = data.get("heading", "")
-            if heading in suggestions:
-                new_heading = suggestions[heading]
+            if not heading:
+                continue
+            new_heading = suggestions.get(heading) or _STATIC_RENAME_LOOKUP.get(
+                heading.casefold()
+            )
+            if new_heading and new_heading != heading:
                 data["heading"] = new_heading
                 result.changes_made.append(
                     f"Renamed heading '{heading}' → '{new_heading}'"
                 )
 
     def _update_skills(
-        self, sections: dict, match_report: dict, result: UpdateResult
+        self, sections: dict, skills_to_add: list[str], result: UpdateResult
     ) -> None:
         """Add missing keywords to the skills section."""
-        missing = match_report.get("missing_keywords", [])
-        placement = match_report.get("keyword_placement", {})
-
-        # Get keywords that should go into skills
-        skills_to_add = [kw for kw in missing if placement.get(kw) == "skills"]
         if not skills_to_add:
             return
 
@@ -151,28 +229,34 @@ class ResumeUpdater:
             skills_section = sections["skills"]
             result.changes_made.append("Added missing 'Skills' section")
 
-        # Get existing skills text
+        # Index existing skills as tokens and comma-separated phrases,
+        # so "java" isn't treated as present just because the line
+        # mentions "javascript" the way a substring check would
         existing_content = skills_section.get("content", [])
-        existing_text = " ".join(existing_content).lower()
+        existing_tokens: set[str] = set()
+        for line in existing_content:
+            line_lower = line.lower()
+            existing_tokens.update(_SKILL_TOKEN_RE.findall(line_lower))
+            # Whole phrases cover multi-word skills like "machine learning"
+            existing_tokens.update(
+                part.strip() for part in line_lower.split(",")
+            )
 
         # Filter out keywords already present (case-insensitive)
         new_skills = [
             kw for kw in skills_to_add
-            if kw.lower() not in existing_text
+            if kw.lower() not in existing_tokens
         ]
 
         if new_skills:
-            # Append new skills to the existing skills line
+            # Capitalize skill names properly and append in one rebuild
+            formatted = ", ".join(map(self._format_skill, new_skills))
             if existing_content:
-                # Add to the last line of skills
-                last_line = existing_content[-1]
-                # Capitalize skill names properly
-                formatted = [self._format_skill(s) for s in new_skills]
-                updated_line = last_line.rstrip(", ") + ", " + ", ".join(formatted)
-                existing_content[-1] = updated_line
+                existing_content[-1] = (
+                    f"{existing_content[-1].rstrip(', ')}, {formatted}"
+                )
             else:
-                formatted = [self._format_skill(s) for s in new_skills]
-                existing_content.append(", ".join(formatted))
+                existing_content.append(formatted)
 
             skills_section["content"] = existing_content
             result.keywords_added.extend(new_skills)
@@ -181,13 +265,9 @@ class ResumeUpdater:
             )
 
     def _update_experience(
-        self, sections: dict, match_report: dict, result: UpdateResult
+        self, sections: dict, exp_keywords: list[str], result: UpdateResult
     ) -> None:
         """Enhance experience bullet points with relevant missing keywords."""
-        missing = match_report.get("missing_keywords", [])
-        placement = match_report.get("keyword_placement", {})
-
-        exp_keywords = [kw for kw in missing if placement.get(kw) == "experience"]
         if not exp_keywords:
             return
 
@@ -195,10 +275,14 @@ class ResumeUpdater:
         if not experience:
             return
 
+        # Pair each keyword with its lowercase form once, instead of
+        # re-lowering every keyword against every line in the scan below
+        pending = [(kw, kw.lower()) for kw in exp_keywords]
+
         # Prefer structured entries if available
         entries = experience.get("entries")
         if entries:
-            self._update_experience_entries(entries, exp_keywords, result)
+            self._update_experience_entries(entries, pending, result)
             return
 
         # Fallback: flat content update (legacy data without entries)
@@ -211,16 +295,15 @@ class ResumeUpdater:
 
         for line in content:
             updated_line = line
-            is_bullet = not re.match(
-                r"^[A-Z][\w\s]+\s*[—\-–]\s*\w", line
-            )
-            if is_bullet and exp_keywords:
-                for kw in list(exp_keywords):
-                    if kw.lower() not in line.lower() and kw not in keywords_used:
+            is_bullet = not _JOB_TITLE_RE.match(line)
+            if is_bullet and pending:
+                line_lower = line.lower()
+                for i, (kw, kw_lower) in enumerate(pending):
+                    if kw_lower not in line_lower:
                         updated_line = self._enhance_bullet(line, kw)
                         if updated_line != line:
                             keywords_used.append(kw)
-                            exp_keywords.remove(kw)
+                            del pending[i]
                             break
 
             updated_content.append(updated_line)
@@ -234,7 +317,10 @@ class ResumeUpdater:
             )
 
     def _update_experience_entries(
-        self, entries: list[dict], exp_keywords: list[str], result: UpdateResult
+        self,
+        entries: list[dict],
+        pending: list[tuple[str, str]],
+        result: UpdateResult,
     ) -> None:
         """Update structured experience entries — only modifies bullets, preserves company/title/dates."""
         keywords_used: list[str] = []
@@ -245,13 +331,14 @@ class ResumeUpdater:
 
             for bullet in bullets:
                 updated = bullet
-                if exp_keywords:
-                    for kw in list(exp_keywords):
-                        if kw.lower() not in bullet.lower() and kw not in keywords_used:
+                if pending:
+                    bullet_lower = bullet.lower()
+                    for i, (kw, kw_lower) in enumerate(pending):
+                        if kw_lower not in bullet_lower:
                             updated = self._enhance_bullet(bullet, kw)
                             if updated != bullet:
                                 keywords_used.append(kw)
-                                exp_keywords.remove(kw)
+                                del pending[i]
                                 break
                 updated_bullets.append(updated)
 
@@ -290,10 +377,9 @@ class ResumeUpdater:
                 break
 
         if keywords_for_summary:
-            formatted = [self._format_skill(kw) for kw in keywords_for_summary]
-            # Append a clause to the summary
-            addition = f" Skilled in {', '.join(formatted)}."
-            content[-1] = content[-1].rstrip(".") + "." + addition
+            # Append a clause to the summary in one rebuild
+            formatted = ", ".join(map(self._format_skill, keywords_for_summary))
+            content[-1] = f"{content[-1].rstrip('.')}. Skilled in {formatted}."
             summary["content"] = content
             result.keywords_added.extend(keywords_for_summary)
             result.changes_made.append(
@@ -302,17 +388,11 @@ class ResumeUpdater:
 
     def _enhance_bullet(self, bullet: str, keyword: str) -> str:
         """Try to naturally enhance a bullet point with a keyword."""
-        formatted_kw = self._format_skill(keyword)
-        # Append "utilizing {keyword}" or "leveraging {keyword}"
-        clean = bullet.rstrip(".")
-        return f"{clean}, utilizing {formatted_kw}."
-
-    def _format_skill(self, skill: str) -> str:
-        """Format a skill keyword for display (capitalize properly)."""
-        # Keep known acronyms uppercase
-        if len(skill) <= 4 and skill.isalpha():
-            return skill.upper() if len(skill) <= 3 else skill.title()
-        # Keep terms with special chars as-is (e.g. c++, node.js)
-        if not skill.isalpha():
-            return skill
-        return skill.title()
+        template = _ENHANCE_TEMPLATES[len(keyword) % len(_ENHANCE_TEMPLATES)]
+        return template.format(
+            c=bullet.rstrip("."), k=self._format_skill(keyword)
+        )
+
+    # Free function so lru_cache doesn't pin self; kept as a method
+    # attribute for existing call sites
+    _format_skill = staticmethod(_format_skill)